@@ -0,0 +1,235 @@
+import cv2
+import numpy as np
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from sources import open_source
+from preprocess import crop_letterbox, model_input
+from test import SignLanguageTranslator
+
+# Benchmarks the recognition pipeline stage by stage on recorded clips and/or
+# synthetic frames. No camera or window needed. Results are saved as JSON so a
+# later run can be compared against them:
+#   python benchmark.py --source clips/session1.mp4 --save bench/baseline.json
+#   python benchmark.py --source clips/session1.mp4 --compare bench/baseline.json
+# --detect-scales instead sweeps the hand detection proxy scale (see "detect_scale"):
+#   python benchmark.py --source clips/session1.mp4 --detect-scales 1,0.75,0.5,0.35
+
+
+def timed(fn, iterations, warmup=5):
+    for _ in range(warmup): fn()
+    times = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def stats(times):
+    ms = np.array(times) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"n": len(ms), "mean_ms": round(float(ms.mean()), 4), "p50_ms": round(p50, 4), "p95_ms": round(p95, 4),
+            "p99_ms": round(p99, 4), "per_s": round(1000 / ms.mean(), 1) if ms.mean() > 0 else 0.0}
+
+
+def load_frames(args):
+    frames = []
+    if args.source:
+        source = open_source(args.source, args.width, args.height)
+        while len(frames) < args.frames:
+            success, img = source.read()
+            if not success: break
+            frames.append(img)
+        source.release()
+    if not frames:
+        # Synthetic: smooth noise background with a skin-toned blob where a hand would be
+        rng = np.random.default_rng(args.seed)
+        for i in range(args.frames):
+            img = cv2.GaussianBlur(rng.integers(0, 255, (args.height, args.width, 3), np.uint8), (9, 9), 0)
+            cv2.ellipse(img, (args.width // 3 + i % 20, args.height // 2), (90, 130), 0, 0, 360, (120, 160, 210), -1)
+            frames.append(img)
+    return frames
+
+
+def run_benchmarks(app, frames, iterations):
+    results = {}
+    h, w, _ = frames[0].shape
+    fallback = {"bbox": (w // 3 - 90, h // 2 - 130, 180, 260), "lmList": [], "type": "Right"}
+
+    # Detection over the whole clip
+    it = itertools.count()
+    results["findHands"] = stats(timed(lambda: app.detector.findHands(frames[next(it) % len(frames)].copy(), draw=False), iterations))
+
+    # Use detected hands where there are any so crops look like the real thing
+    hands = [app.detector.findHands(f.copy(), draw=False) for f in frames]
+    pairs = [(f, hs[0]) for f, hs in zip(frames, hands) if hs] or [(f, fallback) for f in frames]
+    results["hand_frames"] = {"detected": sum(1 for hs in hands if hs), "total": len(frames)}
+
+    it = itertools.count()
+    def letterbox():
+        f, hand = pairs[next(it) % len(pairs)]
+        return crop_letterbox(f, hand['bbox'], app.offset, app.imgSize)
+    results["letterbox"] = stats(timed(letterbox, iterations))
+
+    # Fused path the translator uses: crop + letterbox + resize + normalise into the model input
+    it = itertools.count()
+    tensor, canvas = np.empty((224, 224, 3), np.float32), np.empty((224, 224, 3), np.uint8)
+    def fused():
+        f, hand = pairs[next(it) % len(pairs)]
+        return model_input(f, hand['bbox'], tensor, app.offset, app.imgSize, canvas)
+    results["model_input"] = stats(timed(fused, iterations))
+
+    if app.classifier:
+        crops = [crop_letterbox(f, hand['bbox'], app.offset, app.imgSize) for f, hand in pairs[:50]]
+        crops = [c for c in crops if c is not None]
+        it = itertools.count()
+        results["getPrediction"] = stats(timed(lambda: app.classifier.getPrediction(crops[next(it) % len(crops)], draw=False), iterations))
+        it = itertools.count()
+        results["classify_crop"] = stats(timed(lambda: app.classify_crop(*pairs[next(it) % len(pairs)]), iterations))
+        # Two hands in one batched call (the same hand twice; the cost is what matters)
+        it = itertools.count()
+        def two_hands():
+            f, hand = pairs[next(it) % len(pairs)]
+            return app.classify_crops(f, [hand, hand])
+        results["classify_crops_2"] = stats(timed(two_hands, iterations))
+
+    # Suggestions in every mode (inbuilt: the request itself and the worker's candidate search)
+    words = ["HELLO WOR", "THANK YO", "SIGNBRIDG", "GOOD MORNIN", "PLEAS"]
+    for mode in ["off", "inbuilt", "custom"]:
+        app.suggestion_mode = mode
+        it = itertools.count()
+        def suggest():
+            app.final_text = words[next(it) % len(words)]
+            app.update_suggestions()
+        results[f"update_suggestions_{mode}"] = stats(timed(suggest, iterations))
+    it = itertools.count()
+    results["spell_candidates"] = stats(timed(lambda: app.spell_suggester.compute(words[next(it) % len(words)].split()[-1]), max(iterations // 10, 5), warmup=0))
+    app.spell_suggester.cancel()
+
+    # Full-frame rendering (sidebar, transcript, buttons) on a typical transcript
+    app.final_text = "HELLO WELCOME TO SIGNBRIDGE THANK YOU "
+    app.suggestions = ["THANK", "THANKS"]
+    app.current_letter = "A"
+    it = itertools.count()
+    def render():
+        f, hand = pairs[next(it) % len(pairs)]
+        app.draw_ui(f.copy(), [hand])
+    results["draw_ui"] = stats(timed(render, iterations))
+
+    # Whole per-frame path as run() does it (detect + classify + auto-input)
+    it = itertools.count()
+    results["process_frame"] = stats(timed(lambda: app.process_frame(frames[next(it) % len(frames)]), iterations))
+    return results
+
+
+def scale_sweep(frames, scales, min_recall):
+    # Detection time, recall and landmark error per proxy scale, against full
+    # resolution detection on the same frames. A fresh detector per pass so
+    # MediaPipe's tracking state from one scale doesn't help the next.
+    from cvzone.HandTrackingModule import HandDetector
+    from tracking import ScaledDetector
+
+    def detect_all(scale):
+        detector = ScaledDetector(HandDetector(maxHands=1), scale, min_height=0)
+        times, found = [], []
+        for f in frames:
+            start = time.perf_counter()
+            found.append(detector.findHands(f, draw=False))
+            times.append(time.perf_counter() - start)
+        return times[1:] or times, found # first call includes graph setup
+
+    _, reference = detect_all(1.0)
+    hits = [i for i, hs in enumerate(reference) if hs]
+    results = {}
+    for scale in scales:
+        times, found = detect_all(scale)
+        recalled = [i for i in hits if found[i]]
+        errors = [np.abs(np.array(found[i][0]["lmList"])[:, :2] - np.array(reference[i][0]["lmList"])[:, :2]).mean() for i in recalled]
+        results[f"detect_scale_{scale:g}"] = {**stats(times), "scale": scale,
+                                              "recall": round(len(recalled) / len(hits), 4) if hits else None,
+                                              "false_positives": sum(1 for i, hs in enumerate(reference) if not hs and found[i]),
+                                              "landmark_error_px": round(float(np.mean(errors)), 2) if errors else None}
+
+    print(f"{len(hits)} of {len(frames)} frames have a hand at full resolution\n")
+    print(f"{'scale':>6}{'p50 ms':>9}{'recall':>9}{'false +':>9}{'lm err px':>11}")
+    for r in results.values():
+        recall = f"{r['recall']:.3f}" if r["recall"] is not None else "-"
+        error = f"{r['landmark_error_px']:.2f}" if r["landmark_error_px"] is not None else "-"
+        print(f"{r['scale']:>6g}{r['p50_ms']:>9.2f}{recall:>9}{r['false_positives']:>9}{error:>11}")
+    ok = [r for r in results.values() if r["recall"] is not None and r["recall"] >= min_recall]
+    if ok:
+        best = min(ok, key=lambda r: r["p50_ms"])
+        print(f"\nFastest scale with recall >= {min_recall}: {best['scale']:g} (set \"detect_scale\": {best['scale']:g})")
+    return results
+
+
+def compare(results, baseline, threshold, metric):
+    regressions = []
+    print(f"\n{'benchmark':<28}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, cur in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base or metric not in cur or metric not in base or base[metric] <= 0: continue
+        change = cur[metric] / base[metric] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<28}{base[metric]:>12.3f}{cur[metric]:>12.3f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SignBridge pipeline benchmark")
+    parser.add_argument("--source", help="video file or image folder; synthetic frames if omitted")
+    parser.add_argument("--frames", type=int, default=100, help="frames to load from the source / synthesize")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=["keras", "tflite"], default="keras")
+    parser.add_argument("--save", metavar="FILE", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="flag slowdowns above this fraction")
+    parser.add_argument("--metric", default="p50_ms", choices=["mean_ms", "p50_ms", "p95_ms", "p99_ms"])
+    parser.add_argument("--detect-scales", metavar="LIST", help="comma separated detection scales to sweep instead of the stage benchmarks")
+    parser.add_argument("--min-recall", type=float, default=0.98, help="recall a swept scale needs to be recommended")
+    args = parser.parse_args()
+
+    frames = load_frames(args)
+    if args.detect_scales:
+        results = scale_sweep(frames, [float(s) for s in args.detect_scales.split(",")], args.min_recall)
+    else:
+        app = SignLanguageTranslator(backend=args.backend)
+        results = run_benchmarks(app, frames, args.iterations)
+        for name, r in results.items():
+            if "p50_ms" in r:
+                print(f"{name:<28} p50 {r['p50_ms']:8.3f} ms  p95 {r['p95_ms']:8.3f}  p99 {r['p99_ms']:8.3f}  {r['per_s']:>9.1f}/s")
+            else:
+                print(f"{name:<28} {r}")
+
+    report = {
+        "meta": {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "source": args.source or "synthetic", "frames": len(frames),
+                 "resolution": list(frames[0].shape[:2]), "iterations": args.iterations, "backend": args.backend,
+                 "python": platform.python_version(), "opencv": cv2.__version__, "numpy": np.__version__,
+                 "machine": platform.machine(), "processor": platform.processor(), "cpus": os.cpu_count()},
+        "results": results,
+    }
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.metric)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nNo regressions")
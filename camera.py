@@ -0,0 +1,207 @@
+import cv2
+import threading
+import time
+from collections import deque
+
+# Persistent, low-latency webcam access. The device is opened once per index and
+# kept open between translator sessions; a grab thread reads continuously while
+# any session is active so read() always returns the newest frame (with its
+# capture time) rather than one that sat in the driver's queue. VideoCapture isn't
+# thread-safe, so every call on it holds `cap_lock`.
+_cameras = {}
+_cameras_lock = threading.Lock()
+
+
+def get_camera(index=0, width=1280, height=720, fps=30, fourcc="MJPG", buffer_size=1):
+    # Shared CameraManager for `index`; reconfigured if the requested format changed
+    with _cameras_lock:
+        cam = _cameras.get(index)
+        if cam is None:
+            cam = _cameras[index] = CameraManager(index, width, height, fps, fourcc, buffer_size)
+        else:
+            cam.configure(width, height, fps, fourcc, buffer_size)
+        return cam
+
+
+class CameraManager:
+    def __init__(self, index=0, width=1280, height=720, fps=30, fourcc="MJPG", buffer_size=1):
+        self.index = index
+        self.config = (width, height, fps, fourcc, buffer_size)
+        self.cap = None
+        self.cap_lock = threading.Lock()
+        self.cond = threading.Condition()
+        self.thread = None
+        self.sessions = 0
+        self.flush = False # drop the driver's queued frames before the next read
+        self.low_power = 0 # sessions that only need a frame when they ask (presence standby / idle)
+        self.waiting = 0 # readers blocked in read()
+        self.frame = None
+        self.frame_time = 0.0
+        self.seq = 0
+        self.grab_times = deque(maxlen=60)
+
+    def configure(self, width, height, fps, fourcc, buffer_size):
+        config = (width, height, fps, fourcc, buffer_size)
+        if config != self.config:
+            self.config = config
+            if self.cap is not None: self.apply_config()
+
+    def apply_config(self):
+        width, height, fps, fourcc, buffer_size = self.config
+        with self.cap_lock:
+            # close() may clear self.cap at any time, but only releases it under cap_lock
+            cap = self.cap
+            if cap is None: return
+            # FOURCC first: many UVC drivers only offer high resolutions / frame rates as MJPEG
+            if fourcc: cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps: cap.set(cv2.CAP_PROP_FPS, fps)
+            if buffer_size: cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+
+    def open(self):
+        with self.cap_lock:
+            if self.cap is None or not self.cap.isOpened():
+                cap = cv2.VideoCapture(self.index)
+                if not cap.isOpened(): return False
+                self.cap = cap
+                configure = True
+            else:
+                configure = False
+        if configure: self.apply_config()
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.grab_loop, daemon=True)
+            self.thread.start()
+        return True
+
+    def grab_loop(self):
+        while True:
+            with self.cond:
+                # Idle (device stays open) while no session is reading
+                self.cond.wait_for(lambda: self.sessions > 0 or self.cap is None)
+                if self.cap is None: return
+                flush, self.flush = self.flush, False
+            with self.cap_lock:
+                cap = self.cap
+                if cap is None: return
+                if flush:
+                    # Throw away whatever queued up in the driver while idle
+                    for _ in range(max(1, self.config[4] or 1)): cap.grab()
+                success = cap.grab()
+            now = time.time()
+            # grab() keeps the driver queue drained; the decode (retrieve) is the expensive
+            # part, so while every session is in low-power mode only frames a reader is
+            # already waiting for are decoded
+            with self.cond:
+                decode = success and (self.low_power < self.sessions or self.waiting > 0)
+            img = None
+            if decode:
+                with self.cap_lock:
+                    success, img = cap.retrieve() if self.cap is cap else (False, None)
+            with self.cond:
+                if success:
+                    if decode:
+                        self.frame, self.frame_time = img, now
+                        self.seq += 1
+                    self.grab_times.append(now)
+                else:
+                    self.frame = None
+                self.cond.notify_all()
+            if not success: time.sleep(0.01)
+
+    def read(self, last_seq=0, timeout=2.0):
+        # Newest frame newer than last_seq -> (seq, capture time, image), or None on timeout
+        with self.cond:
+            self.waiting += 1
+            try:
+                if not self.cond.wait_for(lambda: self.seq > last_seq and self.frame is not None, timeout): return None
+            finally:
+                self.waiting -= 1
+            return self.seq, self.frame_time, self.frame
+
+    def effective_fps(self):
+        with self.cond:
+            if len(self.grab_times) < 2: return 0.0
+            return (len(self.grab_times) - 1) / max(self.grab_times[-1] - self.grab_times[0], 1e-6)
+
+    def stats(self):
+        with self.cap_lock:
+            cap = self.cap
+            fourcc = int(cap.get(cv2.CAP_PROP_FOURCC)) if cap is not None else 0
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) if cap is not None else 0
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) if cap is not None else 0
+        return {"fps": round(self.effective_fps(), 1), "requested_fps": self.config[2], "width": width, "height": height,
+                "fourcc": "".join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)) if fourcc else ""}
+
+    def session(self):
+        return CameraSession(self)
+
+    def start_session(self):
+        # Returns the current seq: a new session only reads frames grabbed after it started
+        with self.cond:
+            if self.sessions == 0:
+                # The grab thread flushes the driver queue itself; the device is never used from two threads
+                self.flush = True
+                self.frame = None # left over from the previous session
+                self.grab_times.clear()
+            self.sessions += 1
+            self.cond.notify_all()
+            return self.seq
+
+    def end_session(self, low_power=False):
+        with self.cond:
+            self.sessions = max(0, self.sessions - 1)
+            if low_power: self.low_power = max(0, self.low_power - 1)
+
+    def set_low_power(self, on):
+        with self.cond:
+            self.low_power = max(0, self.low_power + (1 if on else -1))
+            self.cond.notify_all()
+
+    def close(self):
+        with self.cond:
+            cap, self.cap = self.cap, None
+            self.cond.notify_all()
+        if self.thread is not None: self.thread.join(timeout=1.0)
+        if cap is not None:
+            with self.cap_lock: cap.release()
+        with _cameras_lock:
+            if _cameras.get(self.index) is self: del _cameras[self.index]
+
+
+class CameraSession:
+    # Frame source for one translator run (same interface as sources.py).
+    # release() ends the session but leaves the device open for the next one.
+    live = True
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.last_seq = 0
+        self.frame_time = 0.0
+        self.low_power = False
+        self.active = manager.open()
+        if self.active: self.last_seq = manager.start_session()
+
+    def isOpened(self):
+        return self.active
+
+    def read(self):
+        frame = self.manager.read(self.last_seq) if self.active else None
+        if frame is None: return False, None
+        self.last_seq, self.frame_time, img = frame
+        return True, img
+
+    def stats(self):
+        return self.manager.stats()
+
+    def set_low_power(self, on):
+        # Decode only the frames this session reads (used while no hand is in view)
+        if self.active and on != self.low_power:
+            self.low_power = on
+            self.manager.set_low_power(on)
+
+    def release(self):
+        if self.active:
+            self.active = False
+            self.manager.end_session(self.low_power)
+            self.low_power = False
@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+import argparse
+import os
+import sys
+import tensorflow as tf
+from dataset import MappedDataset
+from sources import ImageFolderSource
+from tflite_backend import TFLiteClassifier
+
+# Converts Model/keras_model.h5 to a float16 or int8 TFLite model and checks
+# that top-1 accuracy on held-out Data/<letter> images stays close to Keras.
+LABELS = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model", default=os.path.join("Model", "keras_model.h5"))
+parser.add_argument("--out", default=os.path.join("Model", "model.tflite"))
+parser.add_argument("--quant", choices=["float16", "int8"], default="float16")
+parser.add_argument("--data", default="Data", help="labeled images in <data>/<letter>/*.jpg, or a compiled dataset (dataset.py)")
+parser.add_argument("--val-every", type=int, default=5, help="every Nth image is held out for validation, the rest calibrate int8")
+parser.add_argument("--calib-samples", type=int, default=300)
+parser.add_argument("--max-drop", type=float, default=0.02, help="fail if accuracy drops more than this")
+args = parser.parse_args()
+compiled = MappedDataset(args.data) if os.path.exists(os.path.join(args.data, "manifest.json")) else None
+
+
+def load_split():
+    calib, val = [], []
+    if compiled is not None:
+        train_idx, val_idx = compiled.split(args.val_every)
+        labels = [LABELS.index(compiled.label_names[y]) for y in compiled.labels]
+        return [(i, labels[i]) for i in train_idx], [(i, labels[i]) for i in val_idx]
+    if not os.path.isdir(args.data): return calib, val
+    for letter in sorted(os.listdir(args.data)):
+        if letter not in LABELS: continue
+        source = ImageFolderSource(os.path.join(args.data, letter))
+        for i, path in enumerate(source.paths):
+            (val if i % args.val_every == 0 else calib).append((path, LABELS.index(letter)))
+    return calib, val
+
+
+def load_image(key):
+    # Compiled datasets are indexed by sample, folders by path
+    return compiled.images[key] if compiled is not None else cv2.imread(key)
+
+
+def preprocess(key, size):
+    # Images are already letterboxed crops from datacollection.py
+    img = cv2.resize(load_image(key), size)
+    return (img.astype(np.float32) / 127.0) - 1
+
+
+model = tf.keras.models.load_model(args.model, compile=False)
+_, in_h, in_w, _ = model.input_shape
+calib, val = load_split()
+
+converter = tf.lite.TFLiteConverter.from_keras_model(model)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+if args.quant == "float16":
+    converter.target_spec.supported_types = [tf.float16]
+else:
+    if not calib: sys.exit(f"int8 needs calibration images in {args.data}/<letter>/")
+    rng = np.random.default_rng(0)
+    picks = rng.choice(len(calib), min(args.calib_samples, len(calib)), replace=False)
+
+    def representative_dataset():
+        for i in picks:
+            yield [preprocess(calib[i][0], (in_w, in_h))[None]]
+
+    converter.representative_dataset = representative_dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+
+tflite_model = converter.convert()
+with open(args.out, "wb") as f:
+    f.write(tflite_model)
+print(f"Saved {args.out} ({len(tflite_model) / 1e6:.2f} MB, {os.path.getsize(args.model) / 1e6:.2f} MB original)")
+
+if not val:
+    print("No validation images found, skipping accuracy check")
+    sys.exit(0)
+
+lite = TFLiteClassifier(args.out)
+keras_correct = lite_correct = agree = 0
+for path, label in val:
+    x = preprocess(path, (in_w, in_h))[None]
+    keras_idx = int(np.argmax(model.predict(x, verbose=0)[0]))
+    lite_idx = int(np.argmax(lite.predict(lite.preprocess(cv2.resize(load_image(path), (in_w, in_h)))[None])[0]))
+    keras_correct += keras_idx == label
+    lite_correct += lite_idx == label
+    agree += keras_idx == lite_idx
+
+n = len(val)
+keras_acc, lite_acc = keras_correct / n, lite_correct / n
+print(f"Keras accuracy:  {keras_acc:.3f}")
+print(f"TFLite accuracy: {lite_acc:.3f} ({args.quant})")
+print(f"Agreement:       {agree / n:.3f} on {n} held-out images")
+if keras_acc - lite_acc > args.max_drop:
+    sys.exit(f"Accuracy drop {keras_acc - lite_acc:.3f} exceeds --max-drop {args.max_drop}")
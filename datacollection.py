@@ -1,55 +1,87 @@
 import cv2
-from cvzone.HandTrackingModule import HandDetector
 import numpy as np
-import math
+from cvzone.HandTrackingModule import HandDetector
+import argparse
 import time
-cap = cv2.VideoCapture(0)
-detector = HandDetector(maxHands=1)
+from collections import deque
+from preprocess import letterbox_into
+from shards import ShardWriter
+from tracking import HAND_POLICIES, HandSelector
+
+# Records letterboxed hand crops together with their landmarks into Data/<label>/.
+# Encoding and disk writes happen on background threads, so the camera loop never
+# waits for the disk.
+#   s: save one sample   b: start / stop a timed burst   [ ]: previous / next letter   q: quit
+parser = argparse.ArgumentParser()
+parser.add_argument("--label", default="A", help="label to record (change at runtime with [ and ])")
+parser.add_argument("--folder", default="Data")
+parser.add_argument("--format", choices=["npz", "jpg"], default="npz", help="sharded NPZ files, or one JPEG per sample")
+parser.add_argument("--shard-size", type=int, default=500, help="samples per NPZ shard")
+parser.add_argument("--workers", type=int, default=2, help="JPEG encoding threads")
+parser.add_argument("--burst-seconds", type=float, default=5.0)
+parser.add_argument("--burst-rate", type=float, default=0, help="max samples per second in a burst (0 = every frame with a hand)")
+parser.add_argument("--camera", type=int, default=0)
+parser.add_argument("--size", type=int, default=224, help="saved crop size; the model input size, so crops match inference exactly")
+parser.add_argument("--lossless", action="store_true", help="store PNG instead of JPEG (quality 95) so saved pixels are exact")
+parser.add_argument("--max-hands", type=int, default=1, help="hands to detect; the one recorded is picked by --hand-policy")
+parser.add_argument("--hand-policy", choices=[p for p in HAND_POLICIES if p != "confident"], default="largest")
+parser.add_argument("--dominant", choices=["Right", "Left"], default="Right", help="hand recorded with --hand-policy dominant")
+args = parser.parse_args()
+
+cap = cv2.VideoCapture(args.camera)
+detector = HandDetector(maxHands=args.max_hands)
+selector = HandSelector(args.hand_policy, args.dominant) # same choice the translator makes
 offset = 20
-imgSize = 300
-folder = "Data/T"
+imgSize = 300 # letterbox layout reference, as in SignLanguageTranslator
+labels = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+label = args.label.upper()
+writer = ShardWriter(args.folder, args.shard_size, args.workers, fmt=args.format, lossless=args.lossless)
 counter = 0
+burst_until = 0
+last_sample = 0
+recent = deque() # sample times in the last second, for the live rate
+
 while True:
     success, img = cap.read()
-    hands, img = detector.findHands(img)
-    if hands:
-        hand = hands[0]
-        x, y, w, h = hand['bbox']
-        imgWhite = np.ones((imgSize, imgSize, 3), np.uint8) * 255
-        h_img, w_img, _ = img.shape
-
-        x1 = max(0, x - offset)
-        y1 = max(0, y - offset)
-        x2 = min(w_img, x + w + offset)
-        y2 = min(h_img, y + h + offset)
+    if not success: break
+    hands, imgDraw = detector.findHands(img.copy()) # crops come from the clean frame
+    key = cv2.waitKey(1)
+    now = time.time()
+    if key == ord("b"):
+        burst_until = 0 if now < burst_until else now + args.burst_seconds
+    elif key in (ord("["), ord("]")) and label in labels:
+        writer.flush(label)
+        label = labels[(labels.index(label) + (1 if key == ord("]") else -1)) % len(labels)]
+    bursting = now < burst_until
 
-        imgCrop = img[y1:y2, x1:x2]
+    if hands:
+        hand = hands[selector.select(hands)]
+        if len(hands) > 1:
+            bx, by, bw, bh = hand['bbox']
+            cv2.rectangle(imgDraw, (bx - offset, by - offset), (bx + bw + offset, by + bh + offset), (56, 189, 248), 3)
+        # Same single resample model_input() does at inference, so the saved crop is
+        # exactly the uint8 image the model sees (before JPEG, unless --lossless).
+        # A new array per sample: the writer encodes it on another thread.
+        imgWhite = letterbox_into(img, hand['bbox'], offset, imgSize, np.empty((args.size, args.size, 3), np.uint8))
+        if imgWhite is not None:
+            cv2.imshow("ImageWhite", imgWhite)
+            due = bursting and (args.burst_rate <= 0 or now - last_sample >= 1 / args.burst_rate)
+            if (key == ord("s") or due) and writer.add(label, imgWhite, hand['lmList'], hand['bbox'], hand['type']):
+                counter += 1
+                last_sample = now
+                recent.append(now)
 
-# Safety check
-        if imgCrop.size == 0:
-            continue
+    while recent and now - recent[0] > 1.0: recent.popleft()
+    stats = writer.stats()
+    status = f"{label}: {counter}  {len(recent)}/s" + (f"  BURST {burst_until - now:.1f}s" if bursting else "")
+    disk = f"written {stats['written']}  pending {stats['pending']}  dropped {stats['dropped']}"
+    cv2.putText(imgDraw, status, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (56, 189, 248), 2)
+    cv2.putText(imgDraw, disk, (20, 75), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+    cv2.imshow("Image", imgDraw)
+    if key == ord("q"): break
 
-        imgCropShape = imgCrop.shape
-        aspectRatio = h / w
-        if aspectRatio > 1:
-            k = imgSize / h
-            wCal = math.ceil(k * w)
-            imgResize = cv2.resize(imgCrop, (wCal, imgSize))
-            imgResizeShape = imgResize.shape
-            wGap = math.ceil((imgSize - wCal) / 2)
-            imgWhite[:, wGap:wCal + wGap] = imgResize
-        else:
-            k = imgSize / w
-            hCal = math.ceil(k * h)
-            imgResize = cv2.resize(imgCrop, (imgSize, hCal))
-            imgResizeShape = imgResize.shape
-            hGap = math.ceil((imgSize - hCal) / 2)
-            imgWhite[hGap:hCal + hGap, :] = imgResize
-        cv2.imshow("ImageCrop", imgCrop)
-        cv2.imshow("ImageWhite", imgWhite)
-    cv2.imshow("Image", img)
-    key = cv2.waitKey(1)
-    if key == ord("s"):
-        counter += 1
-        cv2.imwrite(f'{folder}/Image_{time.time()}.jpg',imgWhite)
-        print(counter)
\ No newline at end of file
+cap.release()
+cv2.destroyAllWindows()
+print("Finishing writes...")
+writer.close()
+print(writer.stats())
@@ -0,0 +1,193 @@
+import cv2
+import numpy as np
+import argparse
+import json
+import os
+from shards import read_shard
+
+# Compiled dataset: the Data/<letter> captures (JPEGs and datacollection.py shards)
+# decoded once into raw arrays that are memory-mapped for training / evaluation:
+#   manifest.json   size, count, label names, compiled source files, duplicate count
+#   images.u8       uint8[count, size, size, 3] letterboxed crops, resized to `size`
+#   labels.i16      int16[count] index into the manifest labels
+#   landmarks.f32   float32[count, 21, 3] raw lmList, NaN where the source had none
+#   hands.i8        int8[count] 1 = Right, 0 = Left, -1 = unknown
+#   hashes.u64      uint64[count] dHash of each image, for near-duplicate filtering
+# Files are only ever appended to; the manifest is replaced last, so an interrupted
+# build is rolled back to the previous count on the next run.
+LABELS = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp")
+POP16 = np.array([bin(i).count("1") for i in range(1 << 16)], np.uint8)
+FIELDS = {"images": ("images.u8", np.uint8), "labels": ("labels.i16", np.int16), "landmarks": ("landmarks.f32", np.float32),
+          "hands": ("hands.i8", np.int8), "hashes": ("hashes.u64", np.uint64)}
+
+
+def dhash(img):
+    # 64-bit difference hash: is each pixel of a 9x8 grey thumbnail brighter than its right neighbour
+    small = cv2.resize(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), (9, 8), interpolation=cv2.INTER_AREA)
+    return np.packbits(small[:, 1:] > small[:, :-1]).view(np.uint64)[0]
+
+
+def hamming(hashes, h):
+    x = hashes ^ h
+    return (POP16[x & 0xFFFF] + POP16[(x >> 16) & 0xFFFF] +
+            POP16[(x >> 32) & 0xFFFF] + POP16[(x >> 48) & 0xFFFF])
+
+
+class HashIndex:
+    # Per-label growable arrays of hashes for near-duplicate lookups
+    def __init__(self, hashes=(), labels=()):
+        self.hashes = {}
+        self.counts = {}
+        for h, y in zip(hashes, labels): self.add(int(y), h)
+
+    def add(self, label, h):
+        arr = self.hashes.get(label)
+        n = self.counts.get(label, 0)
+        if arr is None or n == len(arr):
+            grown = np.zeros(max(64, 2 * n), np.uint64)
+            if arr is not None: grown[:n] = arr
+            self.hashes[label] = arr = grown
+        arr[n] = h
+        self.counts[label] = n + 1
+
+    def near(self, label, h, max_distance):
+        n = self.counts.get(label, 0)
+        return n > 0 and bool((hamming(self.hashes[label][:n], h) <= max_distance).any())
+
+
+class MappedDataset:
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "manifest.json")) as f:
+            self.manifest = json.load(f)
+        self.size = self.manifest["size"]
+        self.count = self.manifest["count"]
+        self.label_names = self.manifest["labels"]
+        shapes = {"images": (self.size, self.size, 3), "landmarks": (21, 3)}
+        for field, (name, dtype) in FIELDS.items():
+            shape = (self.count,) + shapes.get(field, ())
+            if self.count:
+                arr = np.memmap(os.path.join(path, name), dtype, "r", shape=shape)
+            else:
+                arr = np.zeros(shape, dtype)
+            setattr(self, field, arr)
+
+    def __len__(self):
+        return self.count
+
+    def split(self, val_every=5):
+        # Same rule as convert_tflite.py: every Nth sample of each label is held out
+        train, val = [], []
+        seen = {}
+        for i, y in enumerate(self.labels):
+            k = seen.get(int(y), 0)
+            seen[int(y)] = k + 1
+            (val if k % val_every == 0 else train).append(i)
+        return np.array(train, np.int64), np.array(val, np.int64)
+
+    def batches(self, batch_size, indices=None):
+        # Yields (images, labels) slices straight from the mapped arrays
+        if indices is None:
+            for start in range(0, self.count, batch_size):
+                yield self.images[start:start + batch_size], self.labels[start:start + batch_size]
+        else:
+            for start in range(0, len(indices), batch_size):
+                idx = np.sort(indices[start:start + batch_size])
+                yield self.images[idx], self.labels[idx]
+
+
+def iter_samples(path):
+    # (image, lmList or None, hand type or None) for every sample in a capture file
+    if path.endswith(".npz"):
+        shard = read_shard(path)
+        for img, lm, hand in zip(shard["images"], shard["landmarks"], shard["hand_type"]):
+            yield img, lm, str(hand)
+    else:
+        img = cv2.imread(path)
+        if img is not None: yield img, None, None
+
+
+def compile_dataset(data_dir, out_dir, size=224, max_distance=3, chunk=256):
+    # Adds every capture file under data_dir/<letter>/ not yet in the manifest.
+    # Returns (added, duplicates) for this run.
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest["size"] != size:
+            raise ValueError(f"{out_dir} was compiled at size {manifest['size']}, not {size}")
+    else:
+        manifest = {"version": 1, "size": size, "count": 0, "labels": LABELS, "sources": [], "duplicates": 0}
+
+    # Drop anything past the last committed count (interrupted run)
+    count = manifest["count"]
+    per_sample = {"images": size * size * 3, "landmarks": 21 * 3}
+    for field, (name, dtype) in FIELDS.items():
+        path = os.path.join(out_dir, name)
+        with open(path, "ab") as f:
+            f.truncate(count * per_sample.get(field, 1) * np.dtype(dtype).itemsize)
+    hashes = np.fromfile(os.path.join(out_dir, FIELDS["hashes"][0]), np.uint64)
+    labels = np.fromfile(os.path.join(out_dir, FIELDS["labels"][0]), np.int16)
+    index = HashIndex(hashes, labels)
+
+    done = set(manifest["sources"])
+    files = {field: open(os.path.join(out_dir, name), "ab") for field, (name, _) in FIELDS.items()}
+    buffers = {field: [] for field in FIELDS}
+    nan_landmarks = np.full((21, 3), np.nan, np.float32)
+    added = duplicates = 0
+
+    def write_chunk():
+        for field, (_, dtype) in FIELDS.items():
+            if buffers[field]: files[field].write(np.asarray(buffers[field], dtype).tobytes())
+            buffers[field].clear()
+
+    try:
+        for letter in sorted(os.listdir(data_dir)):
+            folder = os.path.join(data_dir, letter)
+            if letter not in manifest["labels"] or not os.path.isdir(folder): continue
+            y = manifest["labels"].index(letter)
+            for name in sorted(os.listdir(folder)):
+                rel = f"{letter}/{name}"
+                if rel in done or not name.lower().endswith(IMAGE_EXTS + (".npz",)): continue
+                for img, lm, hand in iter_samples(os.path.join(folder, name)):
+                    if img.shape[:2] != (size, size): img = cv2.resize(img, (size, size))
+                    h = dhash(img)
+                    if max_distance >= 0 and index.near(y, h, max_distance):
+                        duplicates += 1
+                        continue
+                    index.add(y, h)
+                    buffers["images"].append(img)
+                    buffers["labels"].append(y)
+                    buffers["landmarks"].append(nan_landmarks if lm is None else np.asarray(lm, np.float32).reshape(21, 3))
+                    buffers["hands"].append(-1 if hand is None else int(hand == "Right"))
+                    buffers["hashes"].append(h)
+                    added += 1
+                    if len(buffers["images"]) >= chunk: write_chunk()
+                manifest["sources"].append(rel)
+        write_chunk()
+    finally:
+        for f in files.values(): f.close()
+
+    manifest["count"] = count + added
+    manifest["duplicates"] += duplicates
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return added, duplicates
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile Data/<letter> captures into a memory-mapped dataset")
+    parser.add_argument("--data", default="Data")
+    parser.add_argument("--out", default=os.path.join("Data", "compiled"))
+    parser.add_argument("--size", type=int, default=224, help="stored image size (the Keras model input is 224)")
+    parser.add_argument("--max-distance", type=int, default=3, help="dHash bits within which an image counts as a duplicate (-1 keeps all)")
+    args = parser.parse_args()
+
+    added, duplicates = compile_dataset(args.data, args.out, args.size, args.max_distance)
+    ds = MappedDataset(args.out)
+    counts = np.bincount(ds.labels, minlength=len(ds.label_names)) if len(ds) else np.zeros(len(ds.label_names), int)
+    print(f"Added {added} samples, skipped {duplicates} near-duplicates")
+    print(f"{args.out}: {len(ds)} samples, " + ", ".join(f"{l}={c}" for l, c in zip(ds.label_names, counts) if c))
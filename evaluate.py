@@ -0,0 +1,182 @@
+import cv2
+import numpy as np
+import argparse
+import json
+import os
+import sys
+import time
+from dataset import LABELS, MappedDataset, iter_samples
+from landmarks import LandmarkClassifier, normalize_landmarks
+from preprocess import letterbox_into
+
+# Offline accuracy + throughput check for the letter models, no camera needed:
+#   python evaluate.py --data Data/compiled --batch-sizes 1,8,32,64 --min-accuracy 0.9
+# --data takes Data/<letter> folders (JPEGs / datacollection shards), a compiled
+# dataset (dataset.py) or, for --classifier landmarks, Data/landmarks/<letter>.npy.
+# Images are expected to be letterboxed crops; --detect crops raw frames first, the
+# same way SignLanguageTranslator does.
+parser = argparse.ArgumentParser()
+parser.add_argument("--data", default="Data")
+parser.add_argument("--classifier", choices=["image", "landmarks"], default="image")
+parser.add_argument("--backend", choices=["keras", "tflite"], default="keras")
+parser.add_argument("--model", help="model file (default: the one the app loads for the chosen classifier/backend)")
+parser.add_argument("--threads", type=int, default=2, help="TFLite interpreter threads")
+parser.add_argument("--detect", action="store_true", help="images are full frames: detect the hand and letterbox it")
+parser.add_argument("--batch-sizes", default="1,8,32", help="comma separated; accuracy uses the largest")
+parser.add_argument("--throughput-samples", type=int, default=256, help="samples timed per batch size")
+parser.add_argument("--limit", type=int, default=None, help="evaluate at most this many samples")
+parser.add_argument("--report", metavar="FILE", help="write the full report as JSON")
+parser.add_argument("--min-accuracy", type=float, default=None, help="exit 1 if overall accuracy is below this")
+args = parser.parse_args()
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+batch_sizes = sorted({int(b) for b in args.batch_sizes.split(",")})
+
+
+class ImageModel:
+    # Batched version of getPrediction: same resize and [-1, 1] scaling as cvzone / TFLiteClassifier
+    def __init__(self):
+        if args.backend == "tflite":
+            from tflite_backend import TFLiteClassifier
+            self.lite = TFLiteClassifier(args.model or os.path.join(BASE_DIR, "Model", "model.tflite"), num_threads=args.threads)
+            self.size = (self.lite.input_w, self.lite.input_h)
+        else:
+            import tensorflow as tf
+            self.keras = tf.keras.models.load_model(args.model or os.path.join(BASE_DIR, "Model", "keras_model.h5"), compile=False)
+            _, h, w, _ = self.keras.input_shape
+            self.size = (w, h)
+        self.labels = LABELS
+
+    def prepare(self, crops):
+        if args.backend == "tflite":
+            return np.stack([self.lite.preprocess(c) for c in crops])
+        batch = np.empty((len(crops), self.size[1], self.size[0], 3), np.float32)
+        for i, c in enumerate(crops):
+            batch[i] = c if c.shape[1::-1] == self.size else cv2.resize(c, self.size)
+        return batch / 127.0 - 1
+
+    def predict(self, crops):
+        batch = self.prepare(crops)
+        if args.backend == "tflite": return self.lite.predict(batch)
+        return self.keras(batch, training=False).numpy()
+
+
+class LandmarkModel:
+    def __init__(self):
+        self.model = LandmarkClassifier(args.model or os.path.join(BASE_DIR, "Model", "landmark_model.npz"))
+        self.labels = self.model.labels
+
+    def predict(self, vectors):
+        return self.model.predict(np.stack(vectors))
+
+
+def samples():
+    # (letter, model input) pairs: letterboxed crops or normalized landmark vectors
+    detector = None
+    if args.detect:
+        from cvzone.HandTrackingModule import HandDetector
+        detector = HandDetector(mode=True, maxHands=1) # cvzone 1.5.6: static images, no tracking
+
+    def prepare(img, lm, hand):
+        if args.classifier == "landmarks":
+            if lm is None or np.isnan(lm).any():
+                if detector is None: return None
+                hands = detector.findHands(img, draw=False)
+                if not hands: return None
+                lm, hand = hands[0]['lmList'], hands[0]['type']
+            return normalize_landmarks(lm, hand or "Right")
+        if detector is not None:
+            hands = detector.findHands(img.copy(), draw=False)
+            # Straight to the model size, the way the translator crops (preprocess.model_input)
+            return letterbox_into(img, hands[0]['bbox'], 20, 300, np.empty((model.size[1], model.size[0], 3), np.uint8)) if hands else None
+        return img
+
+    if os.path.exists(os.path.join(args.data, "manifest.json")):
+        ds = MappedDataset(args.data)
+        hand_types = {1: "Right", 0: "Left", -1: None}
+        for i in range(len(ds)):
+            yield ds.label_names[ds.labels[i]], prepare(ds.images[i], ds.landmarks[i], hand_types[int(ds.hands[i])])
+    elif args.classifier == "landmarks" and any(f.endswith(".npy") for f in os.listdir(args.data)):
+        for name in sorted(os.listdir(args.data)):
+            if name.endswith(".npy"):
+                for vec in np.load(os.path.join(args.data, name)): yield name[:-4], vec
+    else:
+        for letter in sorted(os.listdir(args.data)):
+            folder = os.path.join(args.data, letter)
+            if letter not in LABELS or not os.path.isdir(folder): continue
+            for name in sorted(os.listdir(folder)):
+                for img, lm, hand in iter_samples(os.path.join(folder, name)):
+                    yield letter, prepare(img, lm, hand)
+
+
+model = LandmarkModel() if args.classifier == "landmarks" else ImageModel()
+confusion = np.zeros((len(LABELS), len(LABELS)), np.int64)
+support = np.zeros(len(LABELS), np.int64) # predictions outside A-Z still count as wrong
+skipped = 0
+timing_set = []
+batch, batch_labels = [], []
+
+
+def run_batch():
+    preds = model.predict(batch).argmax(axis=1)
+    for true, pred in zip(batch_labels, preds):
+        support[true] += 1
+        name = model.labels[pred] if pred < len(model.labels) else None
+        if name in LABELS: confusion[true, LABELS.index(name)] += 1
+    batch.clear()
+    batch_labels.clear()
+
+
+start = time.perf_counter()
+n = 0
+for letter, x in samples():
+    if args.limit and n >= args.limit: break
+    if x is None or letter not in LABELS:
+        skipped += 1 # no hand found / no landmarks / not a letter
+        continue
+    n += 1
+    if len(timing_set) < args.throughput_samples: timing_set.append(x)
+    batch.append(x)
+    batch_labels.append(LABELS.index(letter))
+    if len(batch) == batch_sizes[-1]: run_batch()
+if batch: run_batch()
+elapsed = time.perf_counter() - start
+if n == 0: sys.exit(f"No labeled samples found in {args.data}")
+
+# Throughput per batch size on samples already in memory (model cost only, no disk)
+throughput = {}
+for bs in batch_sizes:
+    chunks = [timing_set[i:i + bs] for i in range(0, len(timing_set), bs)]
+    model.predict(chunks[0]) # warm-up (and TFLite tensor resize)
+    t = time.perf_counter()
+    for chunk in chunks: model.predict(chunk)
+    t = time.perf_counter() - t
+    throughput[bs] = {"samples_per_s": round(len(timing_set) / t, 1), "ms_per_batch": round(t / len(chunks) * 1000, 3)}
+
+correct = np.diag(confusion)
+accuracy = correct.sum() / n
+per_class = {l: round(float(correct[i] / support[i]), 4) for i, l in enumerate(LABELS) if support[i]}
+
+print(f"{n} samples in {elapsed:.1f}s ({n / elapsed:.1f}/s end to end), {skipped} skipped (no usable hand or unknown label)")
+print(f"Accuracy: {accuracy:.4f}")
+print("Per class: " + "  ".join(f"{l} {a:.2f}" for l, a in per_class.items()))
+rows = [i for i in range(len(LABELS)) if support[i] or confusion[:, i].any()]
+print("\nConfusion (rows = true, columns = predicted)")
+print("    " + "".join(f"{LABELS[j]:>5}" for j in rows))
+for i in rows:
+    print(f"{LABELS[i]:>3} " + "".join(f"{confusion[i, j]:>5}" for j in rows))
+print("\nbatch  samples/s  ms/batch")
+for bs, r in throughput.items():
+    print(f"{bs:>5}  {r['samples_per_s']:>9.1f}  {r['ms_per_batch']:>8.3f}")
+
+if args.report:
+    report = {"data": args.data, "classifier": args.classifier, "backend": args.backend, "samples": n, "skipped": skipped,
+              "accuracy": round(float(accuracy), 4), "per_class": per_class, "labels": LABELS,
+              "confusion": confusion.tolist(), "throughput": throughput}
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {args.report}")
+
+if args.min_accuracy is not None and accuracy < args.min_accuracy:
+    sys.exit(f"Accuracy {accuracy:.4f} is below --min-accuracy {args.min_accuracy}")
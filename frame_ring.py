@@ -0,0 +1,176 @@
+import cv2
+import numpy as np
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+
+# Layout of the shared block:
+#   ctrl    int64[4]         latest complete seq, writer-closed flag, unused x2
+#   headers int64[slots, 3]  per slot: begin seq, end seq, capture time (ns)
+#   frames  uint8[slots, H, W, 3]
+# Each slot is a seqlock: the writer bumps `begin`, copies the pixels, then sets
+# `end`. A slot is complete while begin == end, and a reader holding a view can
+# call valid(seq) afterwards to confirm the writer hasn't started overwriting it.
+# Only the creating process unlinks the block; readers are expected to be that
+# process or its children (they share its resource tracker).
+CTRL_LEN = 4
+HEADER_LEN = 3
+
+
+class FrameRing:
+    def __init__(self, shape=(720, 1280, 3), slots=8, name=None, create=True):
+        self.shape = tuple(shape)
+        self.slots = slots
+        header_bytes = (CTRL_LEN + slots * HEADER_LEN) * 8
+        self.frames_offset = (header_bytes + 63) // 64 * 64
+        size = self.frames_offset + slots * int(np.prod(self.shape))
+        self.created = create
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self.name = self.shm.name
+        self.ctrl = np.ndarray((CTRL_LEN,), np.int64, self.shm.buf, 0)
+        self.headers = np.ndarray((slots, HEADER_LEN), np.int64, self.shm.buf, CTRL_LEN * 8)
+        self.frames = np.ndarray((slots,) + self.shape, np.uint8, self.shm.buf, self.frames_offset)
+        if create:
+            self.ctrl[:] = 0
+            self.headers[:] = 0
+
+    # --- writer (one per ring) ---
+    def write(self, img, ts_ns=None):
+        seq = int(self.ctrl[0]) + 1
+        slot = seq % self.slots
+        self.headers[slot, 0] = seq # begin: slot is now being overwritten
+        dst = self.frames[slot]
+        if img.shape == self.shape:
+            np.copyto(dst, img)
+        else:
+            cv2.resize(img, (self.shape[1], self.shape[0]), dst=dst)
+        self.headers[slot, 2] = ts_ns if ts_ns is not None else time.time_ns()
+        self.headers[slot, 1] = seq # end: complete
+        self.ctrl[0] = seq
+        return seq
+
+    def close_writer(self):
+        self.ctrl[1] = 1
+
+    # --- readers (any number, any process) ---
+    def latest_seq(self):
+        return int(self.ctrl[0])
+
+    def writer_closed(self):
+        return bool(self.ctrl[1])
+
+    def latest(self):
+        # Newest complete frame as a zero-copy view: (seq, ts_ns, view) or None
+        for _ in range(self.slots):
+            seq = int(self.ctrl[0])
+            if seq <= 0: return None
+            slot = seq % self.slots
+            ts = int(self.headers[slot, 2])
+            if self.headers[slot, 1] == seq and self.headers[slot, 0] == seq:
+                return seq, ts, self.frames[slot]
+        return None
+
+    def valid(self, seq):
+        # True while the slot holding `seq` hasn't been touched by the writer since
+        return self.headers[seq % self.slots, 0] == seq
+
+    def latest_copy(self, out=None):
+        # Newest frame copied out and verified untorn: (seq, ts_ns, array) or None
+        while True:
+            frame = self.latest()
+            if frame is None: return None
+            seq, ts, view = frame
+            if out is None: out = view.copy()
+            else: np.copyto(out, view)
+            if self.valid(seq): return seq, ts, out
+
+    def close(self):
+        # Views handed out by latest() must be dropped first: shm.close() can't unmap
+        # memory that is still exported
+        self.ctrl = self.headers = self.frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            print("Error closing frame ring: frames from latest() are still referenced")
+        if self.created: self.shm.unlink()
+
+
+class RingSource:
+    # Frame source (same read()/release() interface as sources.py) that waits for
+    # the next frame in a FrameRing written by another process
+    live = True
+
+    def __init__(self, name, shape=(720, 1280, 3), slots=8, copy=False, buffers=2, timeout=5.0):
+        self.ring = FrameRing(shape, slots, name=name, create=False)
+        self.copy = copy
+        # Copies go into a rotating set of preallocated buffers, so reading allocates
+        # nothing; a returned frame stays intact for the next buffers - 1 reads
+        self.buffers = [np.empty(shape, np.uint8) for _ in range(buffers)] if copy else []
+        self.next_buffer = 0
+        self.timeout = timeout
+        self.last_seq = 0
+        self.last_ts = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        deadline = time.time() + self.timeout
+        while self.ring.latest_seq() <= self.last_seq:
+            if self.ring.writer_closed() or time.time() > deadline: return False, None
+            time.sleep(0.001)
+        if self.copy:
+            frame = self.ring.latest_copy(out=self.buffers[self.next_buffer])
+            self.next_buffer = (self.next_buffer + 1) % len(self.buffers)
+        else:
+            frame = self.ring.latest()
+        if frame is None: return False, None
+        self.last_seq, self.last_ts, img = frame
+        return True, img
+
+    def valid(self):
+        # For zero-copy reads: is the last returned view still intact?
+        return self.ring.valid(self.last_seq)
+
+    def release(self):
+        self.ring.close()
+
+
+def capture_main(ring_name, shape, slots, source_spec, loop, stop_event):
+    from sources import open_source
+    ring = FrameRing(shape, slots, name=ring_name, create=False)
+    source = open_source(source_spec, shape[1], shape[0], loop=loop)
+    try:
+        while not stop_event.is_set():
+            success, img = source.read()
+            if not success: break
+            ring.write(img)
+    finally:
+        ring.close_writer()
+        source.release()
+        ring.close()
+
+
+class RingCapture:
+    # Owns a FrameRing and a capture process filling it from a camera / file source
+    def __init__(self, source_spec, shape=(720, 1280, 3), slots=8, loop=False):
+        self.ring = FrameRing(shape, slots, create=True)
+        self.shape = tuple(shape)
+        self.slots = slots
+        ctx = mp.get_context("spawn")
+        self.stop_event = ctx.Event()
+        self.process = ctx.Process(target=capture_main, daemon=True,
+                                   args=(self.ring.name, self.shape, slots, source_spec, loop, self.stop_event))
+
+    def start(self):
+        self.process.start()
+        return self
+
+    def source(self, copy=False, buffers=2):
+        return RingSource(self.ring.name, self.shape, self.slots, copy=copy, buffers=buffers)
+
+    def stop(self):
+        self.stop_event.set()
+        self.process.join(timeout=2.0)
+        if self.process.is_alive(): self.process.terminate()
+        self.ring.close()
@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+import time
+
+# Translation history in SQLite (history.db). Rows carry a timestamp and session
+# metadata; an FTS5 index over the text backs search (plain LIKE if this SQLite
+# build has no FTS5). Appends and deletes touch one row, pages are keyset queries
+# on the primary key, so nothing scales with the size of the history.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    created REAL NOT NULL,
+    session TEXT,
+    meta TEXT
+);
+CREATE INDEX IF NOT EXISTS history_created ON history(created);
+"""
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(text, content='history', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts(history_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+class HistoryStore:
+    def __init__(self, path="history.db", legacy_path="history.txt"):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+        if legacy_path and os.path.exists(legacy_path): self.migrate(legacy_path)
+
+    def migrate(self, legacy_path):
+        # One-time import of the old one-transcript-per-line file; it is renamed
+        # afterwards so it is never imported twice. Lines keep their order and get
+        # the file's modification time, the only timestamp there is.
+        try:
+            created = os.path.getmtime(legacy_path)
+            with open(legacy_path, "r") as f:
+                rows = [(line.strip(), created, "history.txt") for line in f if line.strip()]
+            with self.conn:
+                self.conn.executemany("INSERT INTO history(text, created, session) VALUES (?, ?, ?)", rows)
+            os.replace(legacy_path, legacy_path + ".migrated")
+            print(f"Migrated {len(rows)} transcripts from {legacy_path}")
+        except Exception as e:
+            print(f"Error migrating history: {e}")
+
+    def add(self, text, session=None, meta=None, created=None):
+        with self.conn:
+            cur = self.conn.execute("INSERT INTO history(text, created, session, meta) VALUES (?, ?, ?, ?)",
+                                    (text, created or time.time(), session, json.dumps(meta) if meta else None))
+        return cur.lastrowid
+
+    def delete(self, item_id):
+        with self.conn:
+            return self.conn.execute("DELETE FROM history WHERE id = ?", (item_id,)).rowcount > 0
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM history")
+            if self.fts: self.conn.execute("INSERT INTO history_fts(history_fts) VALUES ('delete-all')")
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def page(self, limit=50, before_id=None, since=None, until=None):
+        # Newest first. Pass the last id of a page as before_id to get the next one.
+        where, params = [], []
+        if before_id is not None: where.append("id < ?"); params.append(before_id)
+        if since is not None: where.append("created >= ?"); params.append(since)
+        if until is not None: where.append("created < ?"); params.append(until)
+        sql = "SELECT id, text, created, session, meta FROM history"
+        if where: sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id DESC LIMIT ?"
+        return [dict(r) for r in self.conn.execute(sql, params + [limit])]
+
+    def search(self, query, limit=50):
+        # Every word must match (as a prefix); best matches first
+        words = query.split()
+        if not words: return self.page(limit)
+        if self.fts:
+            match = " ".join('"' + w.replace('"', '""') + '"*' for w in words)
+            sql = ("SELECT h.id, h.text, h.created, h.session, h.meta FROM history_fts f JOIN history h ON h.id = f.rowid "
+                   "WHERE history_fts MATCH ? ORDER BY f.rank LIMIT ?")
+            return [dict(r) for r in self.conn.execute(sql, (match, limit))]
+        sql = "SELECT id, text, created, session, meta FROM history WHERE " + " AND ".join(["text LIKE ?"] * len(words))
+        return [dict(r) for r in self.conn.execute(sql + " ORDER BY id DESC LIMIT ?", [f"%{w}%" for w in words] + [limit])]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,70 @@
+import cv2
+from cvzone.HandTrackingModule import HandDetector
+import numpy as np
+import argparse
+import os
+from landmarks import normalize_landmarks
+from sources import ImageFolderSource
+
+# Collects normalized hand landmark vectors into Data/landmarks/<label>.npy
+# for train_landmarks.py. Either live (like datacollection.py) or from the
+# existing Data/<letter> image folders.
+parser = argparse.ArgumentParser()
+parser.add_argument("--label", help="letter being recorded (live mode)")
+parser.add_argument("--from-images", metavar="DIR", help="extract from DIR/<letter>/*.jpg instead of the camera")
+parser.add_argument("--out", default="Data/landmarks")
+args = parser.parse_args()
+
+os.makedirs(args.out, exist_ok=True)
+samples = {}
+
+
+def save_samples():
+    for label, rows in samples.items():
+        if not rows: continue
+        path = os.path.join(args.out, f"{label}.npy")
+        data = np.array(rows, np.float32)
+        if os.path.exists(path):
+            data = np.concatenate([np.load(path), data])
+        np.save(path, data)
+        print(f"{label}: {len(data)} samples")
+
+
+if args.from_images:
+    detector = HandDetector(mode=True, maxHands=1) # cvzone 1.5.6: static images, no tracking
+    for letter in sorted(os.listdir(args.from_images)):
+        folder = os.path.join(args.from_images, letter)
+        if not os.path.isdir(folder) or folder == os.path.normpath(args.out): continue
+        source = ImageFolderSource(folder)
+        while True:
+            success, img = source.read()
+            if not success: break
+            hands = detector.findHands(img, draw=False)
+            if hands:
+                vec = normalize_landmarks(hands[0]['lmList'], hands[0]['type'])
+                if vec is not None: samples.setdefault(letter, []).append(vec)
+    save_samples()
+else:
+    if not args.label: parser.error("--label is required in live mode")
+    cap = cv2.VideoCapture(0)
+    detector = HandDetector(maxHands=1)
+    burst = False
+    counter = 0
+    while True:
+        success, img = cap.read()
+        if not success: break
+        hands, img = detector.findHands(img)
+        key = cv2.waitKey(1)
+        # 's' saves one sample, 'b' toggles continuous capture, 'q' saves and quits
+        if key == ord("b"): burst = not burst
+        if hands and (burst or key == ord("s")):
+            vec = normalize_landmarks(hands[0]['lmList'], hands[0]['type'])
+            if vec is not None:
+                samples.setdefault(args.label, []).append(vec)
+                counter += 1
+        cv2.putText(img, f"{args.label}: {counter}{' [BURST]' if burst else ''}", (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (56, 189, 248), 2)
+        cv2.imshow("Image", img)
+        if key == ord("q"): break
+    cap.release()
+    cv2.destroyAllWindows()
+    save_samples()
@@ -0,0 +1,73 @@
+import numpy as np
+
+NUM_LANDMARKS = 21
+FEATURE_SIZE = NUM_LANDMARKS * 3
+
+
+def normalize_landmarks(lmList, hand_type="Right"):
+    # 21 x [x, y, z] pixel landmarks -> translation/scale invariant float32 vector.
+    # Wrist (landmark 0) becomes the origin, the farthest landmark sits at distance 1,
+    # and left hands are mirrored so one model serves both.
+    pts = np.asarray(lmList, dtype=np.float32)[:NUM_LANDMARKS, :3]
+    if pts.shape != (NUM_LANDMARKS, 3): return None
+    pts = pts - pts[0]
+    if hand_type == "Left": pts[:, 0] = -pts[:, 0]
+    scale = np.max(np.linalg.norm(pts[:, :2], axis=1))
+    if scale <= 0: return None
+    return (pts / scale).reshape(-1)
+
+
+class LandmarkClassifier:
+    # Small NumPy MLP over normalize_landmarks() vectors (see train_landmarks.py)
+    def __init__(self, modelPath):
+        data = np.load(modelPath, allow_pickle=False)
+        self.W1 = data["W1"].astype(np.float32)
+        self.b1 = data["b1"].astype(np.float32)
+        self.W2 = data["W2"].astype(np.float32)
+        self.b2 = data["b2"].astype(np.float32)
+        self.labels = [str(l) for l in data["labels"]]
+
+    def predict(self, X):
+        # X: (N, FEATURE_SIZE) -> (N, num_classes) probabilities
+        hidden = np.maximum(X @ self.W1 + self.b1, 0)
+        logits = hidden @ self.W2 + self.b2
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def getPrediction(self, hand):
+        # Same (prediction, index) shape as cvzone's Classifier.getPrediction
+        vec = normalize_landmarks(hand['lmList'], hand.get('type', "Right"))
+        if vec is None: return None, -1
+        probs = self.predict(vec[None, :])[0]
+        return list(probs), int(np.argmax(probs))
+
+
+def train_mlp(X, y, num_classes, hidden=64, epochs=300, lr=0.05, seed=0):
+    # Full-batch gradient descent with momentum; data sets here are a few thousand rows
+    rng = np.random.default_rng(seed)
+    X = X.astype(np.float32)
+    W1 = (rng.standard_normal((X.shape[1], hidden)) * np.sqrt(2.0 / X.shape[1])).astype(np.float32)
+    b1 = np.zeros(hidden, np.float32)
+    W2 = (rng.standard_normal((hidden, num_classes)) * np.sqrt(2.0 / hidden)).astype(np.float32)
+    b2 = np.zeros(num_classes, np.float32)
+    params = [W1, b1, W2, b2]
+    velocity = [np.zeros_like(p) for p in params]
+    onehot = np.eye(num_classes, dtype=np.float32)[y]
+
+    for epoch in range(epochs):
+        h_pre = X @ W1 + b1
+        h = np.maximum(h_pre, 0)
+        logits = h @ W2 + b2
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+
+        d_logits = (probs - onehot) / len(X)
+        d_h = (d_logits @ W2.T) * (h_pre > 0)
+        grads = [X.T @ d_h, d_h.sum(axis=0), h.T @ d_logits, d_logits.sum(axis=0)]
+        for p, v, g in zip(params, velocity, grads):
+            v *= 0.9
+            v -= lr * g
+            p += v
+    return {"W1": W1, "b1": b1, "W2": W2, "b2": b2}
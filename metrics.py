@@ -0,0 +1,123 @@
+import cv2
+import json
+import time
+import tracemalloc
+from collections import deque
+from contextlib import nullcontext
+import numpy as np
+
+STAGES = ["capture", "detect", "preprocess", "classify", "suggestions", "draw", "display", "frame"]
+NULL_STAGE = nullcontext()
+
+
+class StageTimer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    # Rolling per-stage latencies (last `window` samples each) with p50/p95/p99,
+    # an optional on-screen HUD and periodic JSONL export. When disabled, stage()
+    # hands back a shared no-op context so the frame loop pays almost nothing.
+    def __init__(self, window=300, enabled=False, jsonl_path=None, export_interval=10.0):
+        self.window = window
+        self.enabled = enabled
+        self.hud_enabled = False
+        self.jsonl_path = jsonl_path
+        self.export_interval = export_interval
+        self.samples = {name: deque(maxlen=window) for name in STAGES}
+        self.frames = 0
+        self.dropped = 0
+        self.fps = 0.0
+        self.gauges = {} # latest value of non-timing readings, e.g. scheduler mode
+        self.debug_alloc = False
+        self.alloc_base = 0
+        self.last_export = time.time()
+        self.hud_lines = []
+        self.hud_updated = 0.0
+
+    def configure(self, enabled, jsonl_path=None, export_interval=None, debug_alloc=False):
+        self.enabled = enabled or self.hud_enabled or bool(jsonl_path) or debug_alloc
+        self.jsonl_path = jsonl_path
+        if export_interval: self.export_interval = export_interval
+        # Debug only: tracemalloc slows every Python allocation down
+        if debug_alloc and not tracemalloc.is_tracing(): tracemalloc.start()
+        elif self.debug_alloc and not debug_alloc: tracemalloc.stop()
+        self.debug_alloc = debug_alloc
+
+    def toggle_hud(self):
+        self.hud_enabled = not self.hud_enabled
+        if self.hud_enabled: self.enabled = True
+
+    def stage(self, name):
+        return StageTimer(self, name) if self.enabled else NULL_STAGE
+
+    def add(self, name, seconds):
+        self.samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+
+    def set_gauge(self, name, value):
+        self.gauges[name] = value
+
+    def frame_begin(self):
+        if self.debug_alloc:
+            tracemalloc.reset_peak()
+            self.alloc_base = tracemalloc.get_traced_memory()[0]
+
+    def frame_done(self, fps=None, dropped=None):
+        if not self.enabled: return
+        if self.debug_alloc:
+            # Peak extra memory held during the frame (numpy / OpenCV arrays included);
+            # near zero once the loop reuses its buffers
+            self.set_gauge("alloc_kb", round((tracemalloc.get_traced_memory()[1] - self.alloc_base) / 1024))
+        self.frames += 1
+        if fps is not None: self.fps = fps
+        if dropped is not None: self.dropped = dropped
+        if self.jsonl_path and time.time() - self.last_export >= self.export_interval:
+            self.export()
+
+    def summary(self):
+        stages = {}
+        for name, values in list(self.samples.items()):
+            if not values: continue
+            ms = np.array(list(values)) * 1000
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            stages[name] = {"p50": round(p50, 3), "p95": round(p95, 3), "p99": round(p99, 3),
+                            "mean": round(float(ms.mean()), 3), "n": len(values)}
+        return {"ts": time.time(), "fps": round(self.fps, 2), "frames": self.frames, "dropped": self.dropped,
+                "gauges": dict(self.gauges), "stages": stages}
+
+    def export(self):
+        self.last_export = time.time()
+        try:
+            with open(self.jsonl_path, "a") as f:
+                f.write(json.dumps(self.summary()) + "\n")
+        except Exception as e:
+            print(f"Error writing metrics: {e}")
+
+    def draw_hud(self, img, x=10, y=20):
+        if not self.hud_enabled: return
+        # Percentiles are refreshed twice a second, not every frame
+        now = time.time()
+        if now - self.hud_updated > 0.5:
+            self.hud_updated = now
+            s = self.summary()
+            self.hud_lines = [f"FPS {s['fps']:.1f}  dropped {s['dropped']}"]
+            if s["gauges"]: self.hud_lines.append("  ".join(f"{k} {v}" for k, v in s["gauges"].items()))
+            self.hud_lines.append("stage        p50    p95    p99 ms")
+            for name in STAGES:
+                st = s["stages"].get(name)
+                if st: self.hud_lines.append(f"{name:<11}{st['p50']:>6.1f} {st['p95']:>6.1f} {st['p99']:>6.1f}")
+        cv2.rectangle(img, (x - 5, y - 15), (x + 250, y + 16 * len(self.hud_lines) - 8), (0, 0, 0), -1)
+        for i, line in enumerate(self.hud_lines):
+            cv2.putText(img, line, (x, y + i * 16), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 255, 0), 1)
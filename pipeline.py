@@ -0,0 +1,125 @@
+import cv2
+import queue
+import threading
+import time
+
+
+class FrameQueue:
+    # Bounded queue. Live sources drop the oldest frame when full so readers
+    # always get the newest one; file sources block instead so nothing is lost.
+    def __init__(self, maxsize=1, drop=True):
+        self.q = queue.Queue(maxsize)
+        self.drop = drop
+        self.dropped = 0
+
+    def put(self, item, stop_event=None):
+        while True:
+            if not self.drop:
+                try:
+                    self.q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    if stop_event is not None and stop_event.is_set(): return
+                    continue
+            try:
+                self.q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.q.get_nowait()
+                    self.dropped += 1
+                except queue.Empty: pass
+
+    def get(self, timeout=0.1):
+        try: return self.q.get(timeout=timeout)
+        except queue.Empty: return None
+
+    def empty(self):
+        return self.q.empty()
+
+
+class TranslatorPipeline:
+    # capture thread -> infer_queue -> inference thread -> latest result
+    #                \-> render_queue -> caller's (UI) thread
+    def __init__(self, translator, source, queue_size=1, render=True):
+        self.translator = translator
+        self.source = source
+        drop = getattr(source, "live", True)
+        self.infer_queue = FrameQueue(queue_size, drop)
+        self.render_queue = FrameQueue(queue_size, drop) if render else None
+        self.stop_event = threading.Event()
+        self.threads = []
+
+        # Latest inference result: (frame seq, hands, letter)
+        self.result_cond = threading.Condition()
+        self.result = (-1, [], "")
+
+        # Stage counters
+        self.captured = 0
+        self.inferred = 0
+        self.capture_done = False
+        self.inference_done = False
+
+    def start(self):
+        self.threads = [
+            threading.Thread(target=self.capture_loop, daemon=True),
+            threading.Thread(target=self.inference_loop, daemon=True),
+        ]
+        for t in self.threads: t.start()
+
+    def stop(self):
+        self.stop_event.set()
+        for t in self.threads: t.join(timeout=1.0)
+
+    def capture_loop(self):
+        while not self.stop_event.is_set():
+            with self.translator.metrics.stage("capture"):
+                success, img = self.source.read()
+            if not success: break
+            if self.translator.mirror_mode: img = cv2.flip(img, 1)
+            frame = (self.captured, time.time(), img)
+            self.infer_queue.put(frame, self.stop_event)
+            if self.render_queue is not None:
+                self.render_queue.put(frame, self.stop_event)
+            self.captured += 1
+        self.capture_done = True
+
+    def inference_loop(self):
+        while not self.stop_event.is_set():
+            frame = self.infer_queue.get()
+            if frame is None:
+                if self.capture_done and self.infer_queue.empty(): break
+                continue
+            seq, ts, img = frame
+            hands, letter = self.translator.detect_and_classify(img)
+            with self.result_cond:
+                self.result = (seq, hands, letter)
+                self.inferred += 1
+                self.result_cond.notify_all()
+        with self.result_cond:
+            self.inference_done = True
+            self.result_cond.notify_all()
+
+    def latest_result(self):
+        with self.result_cond:
+            return self.result
+
+    def wait_result(self, last_seq, timeout=0.1):
+        # Block until a result newer than last_seq exists; None on timeout / end of stream
+        with self.result_cond:
+            self.result_cond.wait_for(lambda: self.result[0] != last_seq or self.inference_done, timeout)
+            if self.result[0] == last_seq: return None
+            return self.result
+
+    def next_frame(self, timeout=0.1):
+        return self.render_queue.get(timeout)
+
+    def finished(self):
+        if self.render_queue is not None:
+            return self.capture_done and self.render_queue.empty()
+        return self.inference_done
+
+    def dropped(self):
+        dropped = self.infer_queue.dropped
+        if self.render_queue is not None: dropped += self.render_queue.dropped
+        return dropped
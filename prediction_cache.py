@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+import numpy as np
+from landmarks import NUM_LANDMARKS, normalize_landmarks
+
+
+def landmark_signature(hand, quant=0.05):
+    # Translation/scale normalized x, y of the 21 landmarks snapped to a `quant` grid.
+    # Holding a pose still maps to the same key frame after frame.
+    vec = normalize_landmarks(hand['lmList'], hand.get('type', "Right"))
+    if vec is None: return None
+    xy = vec.reshape(NUM_LANDMARKS, 3)[:, :2]
+    return (hand.get('type', "Right"), np.round(xy / quant).astype(np.int16).tobytes())
+
+
+class PredictionCache:
+    # Small LRU of classifier outputs keyed by landmark_signature(). Entries expire
+    # after `ttl` seconds so a held pose is still re-classified periodically.
+    def __init__(self, max_size=64, ttl=0.5, quant=0.05):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.quant = quant
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, hand):
+        return landmark_signature(hand, self.quant)
+
+    def get(self, key):
+        entry = self.entries.get(key) if key is not None else None
+        if entry is None or time.time() - entry[0] > self.ttl:
+            if entry is not None: del self.entries[key]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, value):
+        if key is None: return
+        self.entries[key] = (time.time(), value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0, "size": len(self.entries)}
@@ -0,0 +1,59 @@
+import cv2
+import numpy as np
+import math
+
+
+def letterbox_layout(bbox, frame_shape, offset=20, imgSize=300, out_size=None):
+    # Pad the hand bbox by `offset` (clipped to the frame) and work out where that
+    # crop lands on the white imgSize x imgSize canvas: stretched to the bbox's
+    # aspect ratio, full height or full width, centred. Returns the crop box and
+    # its destination box on the canvas scaled to out_size (w, h), or None for an
+    # empty crop. The mapping is a scale + translate, so cv2.resize into the
+    # destination box is the whole affine transform in one resample.
+    h, w = frame_shape[:2]
+    x, y, bw, bh = bbox
+    x1, y1 = max(0, x - offset), max(0, y - offset)
+    x2, y2 = min(w, x + bw + offset), min(h, y + bh + offset)
+    if x2 <= x1 or y2 <= y1 or bw <= 0 or bh <= 0: return None
+
+    if bh / bw > 1:
+        rw, rh = math.ceil(imgSize / bh * bw), imgSize
+    else:
+        rw, rh = imgSize, math.ceil(imgSize / bw * bh)
+    gx, gy = (imgSize - rw) // 2, (imgSize - rh) // 2
+    ow, oh = out_size or (imgSize, imgSize)
+    fx, fy = ow / imgSize, oh / imgSize
+    dx1, dy1 = round(gx * fx), round(gy * fy)
+    dx2, dy2 = max(dx1 + 1, round((gx + rw) * fx)), max(dy1 + 1, round((gy + rh) * fy))
+    return (x1, y1, x2, y2), (dx1, dy1, dx2, dy2)
+
+
+def letterbox_into(img, bbox, offset, imgSize, out):
+    # Letterboxed hand crop written into `out` (uint8, any size) in one resample
+    layout = letterbox_layout(bbox, img.shape, offset, imgSize, out.shape[1::-1])
+    if layout is None: return None
+    (x1, y1, x2, y2), (dx1, dy1, dx2, dy2) = layout
+    out.fill(255)
+    cv2.resize(img[y1:y2, x1:x2], (dx2 - dx1, dy2 - dy1), dst=out[dy1:dy2, dx1:dx2])
+    return out
+
+
+def crop_letterbox(img, bbox, offset=20, imgSize=300, out=None):
+    # Pad the hand bbox by `offset`, crop it from the clean frame and fit it
+    # (aspect preserved, centred) into a white imgSize x imgSize canvas.
+    # `out` is an optional reusable (imgSize, imgSize, 3) uint8 canvas.
+    # Training crops (datacollection.py) come from here, so they share model_input's layout.
+    if out is None: out = np.empty((imgSize, imgSize, 3), np.uint8)
+    return letterbox_into(img, bbox, offset, imgSize, out)
+
+
+def model_input(img, bbox, out, offset=20, imgSize=300, canvas=None):
+    # Fused crop + letterbox + resize to the model resolution + [-1, 1] scaling,
+    # written into `out`, a preallocated float32 (H, W, 3) input tensor. Matches
+    # crop_letterbox followed by cvzone's resize and normalisation, with one
+    # resample instead of two. `canvas` is an optional reusable (H, W, 3) uint8 scratch.
+    if canvas is None: canvas = np.empty(out.shape, np.uint8)
+    if letterbox_into(img, bbox, offset, imgSize, canvas) is None: return None
+    np.divide(canvas, np.float32(127.0), out=out)
+    np.subtract(out, 1, out=out)
+    return out
@@ -0,0 +1,59 @@
+import time
+from collections import deque
+
+MODES = ("active", "standby", "idle")
+
+
+class PresenceScheduler:
+    # Frame-rate levels driven by how long ago a hand was last seen:
+    #   active   hand seen within `standby_after` s: full rate, full pipeline
+    #   standby  no hand for `standby_after` s: full pipeline capped at `standby_fps`
+    #   idle     no hand for `idle_after` s: `idle_fps`, hand detection only, at
+    #            `idle_scale` of the frame size
+    # Any detected hand switches straight back to active.
+    def __init__(self, enabled=False, standby_after=3.0, idle_after=15.0, standby_fps=10, idle_fps=4, idle_scale=0.5):
+        self.enabled = enabled
+        self.standby_after = standby_after
+        self.idle_after = idle_after
+        self.standby_fps = standby_fps
+        self.idle_fps = idle_fps
+        self.idle_scale = idle_scale
+        self.mode = "active"
+        self.last_seen = time.time()
+        self.mode_since = self.last_seen
+        self.mode_time = {m: 0.0 for m in MODES}
+        self.frames = deque(maxlen=120) # (busy seconds, total seconds) per frame
+
+    def reset(self):
+        self.last_seen = self.mode_since = time.time()
+        self.mode = "active"
+        self.frames.clear()
+
+    def update(self, hand_seen):
+        # Returns True when the mode changed
+        now = time.time()
+        if hand_seen: self.last_seen = now
+        absent = now - self.last_seen
+        mode = "active" if absent < self.standby_after else "standby" if absent < self.idle_after else "idle"
+        if mode == self.mode: return False
+        self.mode_time[self.mode] += now - self.mode_since
+        self.mode, self.mode_since = mode, now
+        return True
+
+    def throttle(self, frame_start):
+        # Sleeps out the rest of this mode's frame interval; frame_start is a perf_counter() value
+        busy = time.perf_counter() - frame_start
+        fps = self.standby_fps if self.mode == "standby" else self.idle_fps if self.mode == "idle" else 0
+        if fps > 0 and busy < 1.0 / fps: time.sleep(1.0 / fps - busy)
+        self.frames.append((busy, time.perf_counter() - frame_start))
+
+    def duty_cycle(self):
+        # Share of wall time spent working rather than sleeping, over recent frames
+        total = sum(t for _, t in self.frames)
+        return sum(b for b, _ in self.frames) / total if total > 0 else 1.0
+
+    def stats(self):
+        times = dict(self.mode_time)
+        times[self.mode] += time.time() - self.mode_since
+        return {"mode": self.mode, "duty_cycle": round(self.duty_cycle(), 3),
+                "seconds": {m: round(t, 1) for m, t in times.items()}}
@@ -0,0 +1,139 @@
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+class TranscriptWrapper:
+    # Word-wraps the transcript like the original per-frame loop, but only re-measures
+    # from the line holding the first changed word (normally just the last line).
+    def __init__(self, max_w):
+        self.max_w = max_w
+        self.words = []
+        self.lines = [""]
+        self.starts = [0] # index of the first word of each line
+
+    def wrap(self, words):
+        if words == self.words: return self.lines
+        i = 0
+        n = min(len(words), len(self.words))
+        while i < n and words[i] == self.words[i]: i += 1
+
+        # Every line after the first opens with its start word already placed
+        li = len(self.starts) - 1
+        while li > 0 and self.starts[li] >= i: li -= 1
+        if li == 0:
+            lines, starts, curr_line, j = [], [0], "", 0
+        else:
+            lines, starts = self.lines[:li], self.starts[:li + 1]
+            curr_line, j = words[starts[li]] + " ", starts[li] + 1
+
+        for k in range(j, len(words)):
+            word = words[k]
+            (tw, _), _ = cv2.getTextSize(curr_line + word + " ", FONT, 0.6, 1)
+            if tw > self.max_w:
+                lines.append(curr_line)
+                starts.append(k)
+                curr_line = word + " "
+            else:
+                curr_line += word + " "
+        lines.append(curr_line)
+
+        self.words, self.lines, self.starts = list(words), lines, starts
+        return lines
+
+
+class RenderCache:
+    # Sidebar: the text layer (title, suggestions, wrapped transcript, ghost text) is
+    # rendered once per text change and stamped onto the blended 320 px ROI each frame.
+    # Buttons: circle + icon + label pre-rendered as premultiplied sprites per hover state.
+    def __init__(self, draw_circle_btn, sidebar_w=320):
+        self.draw_circle_btn = draw_circle_btn
+        self.sidebar_w = sidebar_w
+        self.wrapper = TranscriptWrapper(sidebar_w - 40)
+        self.layer_key = None
+        self.bg_fill = None
+        self.text_idx = None
+        self.text_px = None
+        self.sprites = {}
+
+    def text_layer(self, h, bg_color, txt_color, final_text, suggestions, suggestion_mode):
+        key = (h, bg_color, txt_color, final_text, tuple(suggestions), suggestion_mode)
+        if key == self.layer_key: return
+        self.layer_key = key
+        sw = self.sidebar_w
+        if self.bg_fill is None or self.bg_fill.shape[0] != h or tuple(self.bg_fill[0, 0]) != bg_color:
+            self.bg_fill = np.empty((h, sw, 3), np.uint8)
+            self.bg_fill[:] = bg_color
+        layer = self.bg_fill.copy()
+
+        cv2.putText(layer, "TRANSLATION", (20, 40), cv2.FONT_HERSHEY_DUPLEX, 0.6, (56, 189, 248), 1)
+        cv2.line(layer, (20, 55), (sw - 20, 55), (80, 80, 80), 1)
+
+        # Suggestions List (Visual UI)
+        if suggestions:
+            cv2.putText(layer, f"SUGGESTIONS ({suggestion_mode.upper()}):", (20, 80), FONT, 0.4, (200, 200, 200), 1)
+            for i, sugg in enumerate(suggestions):
+                cv2.putText(layer, f"[{i+1}] {sugg}", (20, 105 + (i * 25)), FONT, 0.5, (56, 189, 248), 1)
+
+        # --- TRANSCRIPT RENDERING ---
+        text_y = 210
+        words = final_text.split()
+
+        # Ghost Text Logic: Show the top suggestion at the end of the text
+        ghost_sugg = ""
+        if suggestion_mode != "off" and suggestions and len(words) > 0:
+            current_word = words[-1]
+            top_sugg = suggestions[0]
+            if top_sugg.upper().startswith(current_word.upper()):
+                ghost_sugg = top_sugg[len(current_word):]
+
+        display_lines = self.wrapper.wrap(words)[-15:]
+        for i, line in enumerate(display_lines):
+            cv2.putText(layer, line, (20, text_y + (i * 28)), FONT, 0.6, txt_color, 1, cv2.LINE_AA)
+            if i == len(display_lines) - 1 and ghost_sugg:
+                (line_w, _), _ = cv2.getTextSize(line, FONT, 0.6, 1)
+                cv2.putText(layer, ghost_sugg, (20 + line_w, text_y + (i * 28)), FONT, 0.6, (150, 150, 150), 1, cv2.LINE_AA)
+
+        # Keep only the pixels that differ from the background
+        self.text_idx = np.nonzero(np.any(layer != self.bg_fill, axis=2))
+        self.text_px = layer[self.text_idx]
+
+    def draw_sidebar(self, img, bg_color, txt_color, final_text, suggestions, suggestion_mode):
+        h, w, _ = img.shape
+        self.text_layer(h, bg_color, txt_color, final_text, suggestions, suggestion_mode)
+        roi = img[:, w - self.sidebar_w:]
+        cv2.addWeighted(self.bg_fill, 0.9, roi, 0.1, 0, dst=roi)
+        roi[self.text_idx] = self.text_px
+
+    def sprite(self, radius, color, icon, label, is_hover):
+        key = (radius, color, icon, label, is_hover)
+        if key not in self.sprites:
+            (tw, th), _ = cv2.getTextSize(label, FONT, 0.4, 1)
+            # Label sits at (cx - 25, cy + 45) like the original layout
+            half_w = max(radius + 2, 25, tw - 25 + 2)
+            cx, cy = half_w, radius + 2
+            patch = np.zeros((cy + 45 + 6, 2 * half_w, 3), np.uint8)
+            alpha = np.zeros(patch.shape[:2], np.uint8)
+            self.draw_circle_btn(patch, (cx, cy), radius, color, icon, is_hover)
+            cv2.circle(alpha, (cx, cy), radius, 255, -1, cv2.LINE_AA)
+            cv2.putText(patch, label, (cx - 25, cy + 45), FONT, 0.4, (200, 200, 200), 1)
+            cv2.putText(alpha, label, (cx - 25, cy + 45), FONT, 0.4, 255, 1)
+            a = cv2.cvtColor(alpha, cv2.COLOR_GRAY2BGR).astype(np.float32) / 255
+            work = np.empty(patch.shape, np.float32) # per-sprite scratch for the blend
+            self.sprites[key] = (patch.astype(np.float32), 1 - a, (cx, cy), work)
+        return self.sprites[key]
+
+    def draw_button(self, img, center, radius, color, icon, label, is_hover):
+        patch, inv_alpha, (cx, cy), work = self.sprite(radius, color, icon, label, is_hover)
+        x1, y1 = center[0] - cx, center[1] - cy
+        ph, pw, _ = patch.shape
+        if x1 < 0 or y1 < 0 or x1 + pw > img.shape[1] or y1 + ph > img.shape[0]:
+            # Too close to the edge for the sprite, draw directly
+            self.draw_circle_btn(img, center, radius, color, icon, is_hover)
+            cv2.putText(img, label, (center[0] - 25, center[1] + 45), FONT, 0.4, (200, 200, 200), 1)
+            return
+        roi = img[y1:y1 + ph, x1:x1 + pw]
+        np.multiply(roi, inv_alpha, out=work)
+        np.add(work, patch, out=work)
+        np.copyto(roi, work, casting="unsafe")
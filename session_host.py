@@ -0,0 +1,156 @@
+import cv2
+import numpy as np
+import argparse
+import json
+import multiprocessing as mp
+import queue
+import time
+from collections import deque
+
+# Runs N independent translator sessions (own source, settings, transcript) on a
+# pool of worker processes so they don't share one GIL. Sessions are spread
+# round-robin over the workers; each worker loads the model weights once and
+# every session it hosts reuses them.
+
+
+def worker_main(worker_id, specs, backend, stop_event, stats_queue, report_interval):
+    # Heavy imports happen in the worker, never in the host process
+    from test import SignLanguageTranslator
+    from sources import open_source
+
+    shared = None
+    sessions = []
+    for spec in specs:
+        translator = SignLanguageTranslator(backend=backend, shared=shared)
+        translator.configure(spec.get("settings", {}))
+        shared = shared or translator
+        translator.running = True
+        source = open_source(spec["source"], translator.WINDOW_W, translator.WINDOW_H, loop=spec.get("loop", False),
+                             camera=translator.camera_config)
+        window_name = f"SignBridge - {spec['id']}"
+        if spec.get("display"):
+            cv2.namedWindow(window_name)
+            cv2.setMouseCallback(window_name, translator.mouse_event)
+        sessions.append({"id": spec["id"], "translator": translator, "source": source, "window": window_name,
+                         "display": spec.get("display", False), "active": True, "frames": 0,
+                         "latency": deque(maxlen=300), "window_frames": 0})
+
+    def report(done=False):
+        now = time.time()
+        rows = []
+        for s in sessions:
+            lat = np.array(s["latency"]) * 1000 if s["latency"] else np.zeros(1)
+            rows.append({"id": s["id"], "worker": worker_id, "active": s["active"], "frames": s["frames"],
+                         "fps": round(s["window_frames"] / max(now - last_report, 1e-6), 2),
+                         "latency_p50_ms": round(float(np.percentile(lat, 50)), 2),
+                         "latency_p95_ms": round(float(np.percentile(lat, 95)), 2),
+                         "letter": s["translator"].current_letter, "text": s["translator"].final_text, "done": done})
+            s["window_frames"] = 0
+        stats_queue.put(rows)
+
+    last_report = time.time()
+    try:
+        while not stop_event.is_set() and any(s["active"] for s in sessions):
+            for s in sessions:
+                if not s["active"]: continue
+                translator = s["translator"]
+                success, img = s["source"].read()
+                if not success or not translator.running:
+                    s["active"] = False
+                    continue
+                if translator.mirror_mode: img = cv2.flip(img, 1)
+
+                start = time.perf_counter()
+                hands = translator.process_frame(img)
+                s["latency"].append(time.perf_counter() - start)
+                if s["display"]: translator.render_frame(s["window"], img, hands)
+                s["frames"] += 1
+                s["window_frames"] += 1
+            if time.time() - last_report >= report_interval:
+                report()
+                last_report = time.time()
+    except KeyboardInterrupt:
+        pass # Ctrl+C reaches the workers too; still release sources and report
+
+    for s in sessions:
+        s["active"] = False
+        s["source"].release()
+    if any(s["display"] for s in sessions): cv2.destroyAllWindows()
+    report(done=True)
+
+
+class SessionHost:
+    def __init__(self, specs, workers=None, backend="keras", report_interval=1.0):
+        # specs: [{"id": "desk1", "source": "0", "settings": {...}, "display": False, "loop": False}, ...]
+        self.specs = specs
+        self.workers = max(1, min(workers or mp.cpu_count(), len(specs)))
+        self.backend = backend
+        self.report_interval = report_interval
+        self.ctx = mp.get_context("spawn") # TF / MediaPipe threads don't survive fork
+        self.stop_event = self.ctx.Event()
+        self.stats_queue = self.ctx.Queue()
+        self.processes = []
+        self.session_stats = {spec["id"]: {"id": spec["id"], "frames": 0, "fps": 0.0, "active": True} for spec in specs}
+
+    def start(self):
+        for w in range(self.workers):
+            assigned = self.specs[w::self.workers]
+            p = self.ctx.Process(target=worker_main, daemon=True,
+                                 args=(w, assigned, self.backend, self.stop_event, self.stats_queue, self.report_interval))
+            p.start()
+            self.processes.append(p)
+
+    def poll(self, timeout=0.0):
+        # Drain worker reports into session_stats; returns the latest counters
+        deadline = time.time() + timeout
+        while True:
+            try:
+                rows = self.stats_queue.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                break
+            for row in rows: self.session_stats[row["id"]] = row
+        return self.session_stats
+
+    def running(self):
+        return any(p.is_alive() for p in self.processes)
+
+    def stop(self, timeout=5.0):
+        self.stop_event.set()
+        end = time.time() + timeout
+        while self.running() and time.time() < end: self.poll(0.1)
+        for p in self.processes:
+            p.join(timeout=0.1)
+            if p.is_alive(): p.terminate()
+        self.poll()
+        return self.session_stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several translator sessions on worker processes")
+    parser.add_argument("--source", action="append", default=[], help="camera index, video file or image folder (repeat per session)")
+    parser.add_argument("--config", help='JSON list of session specs: [{"id", "source", "settings", "display", "loop"}]')
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core, at most one per session)")
+    parser.add_argument("--backend", choices=["keras", "tflite"], default="keras")
+    parser.add_argument("--display", action="store_true", help="open a window per session")
+    parser.add_argument("--loop", action="store_true")
+    args = parser.parse_args()
+
+    if args.config:
+        with open(args.config) as f:
+            specs = json.load(f)
+    else:
+        specs = [{"id": f"session{i}", "source": src, "display": args.display, "loop": args.loop} for i, src in enumerate(args.source)]
+    if not specs: parser.error("give at least one --source or a --config")
+
+    host = SessionHost(specs, args.workers, args.backend)
+    host.start()
+    print(f"{len(specs)} session(s) on {host.workers} worker(s)")
+    try:
+        while host.running():
+            stats = host.poll(2.0)
+            total = sum(s.get("fps", 0.0) for s in stats.values())
+            print(" | ".join(f"{s['id']}: {s.get('fps', 0.0):5.1f} fps p95 {s.get('latency_p95_ms', 0.0):5.1f} ms" for s in stats.values()) + f" | total {total:.1f} fps")
+    except KeyboardInterrupt:
+        pass
+    for s in host.stop().values():
+        print(f"{s['id']}: {s['frames']} frames, text: {s.get('text', '')!r}")
@@ -0,0 +1,124 @@
+import cv2
+import numpy as np
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Dataset shards: one NPZ per `shard_size` samples of a label, Data/<label>/shard_*.npz
+#   jpeg      uint8[total]     JPEG (or, lossless, PNG) bytes of every crop, back to back
+#   offsets   int64[n + 1]     sample i is jpeg[offsets[i]:offsets[i + 1]]
+#   landmarks float32[n, 21, 3] raw cvzone lmList (pixels)
+#   bbox      int32[n, 4]
+#   hand_type <U5[n]
+#   ts        float64[n]       capture time
+
+
+def encode_jpeg(img, quality=95):
+    success, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not success: raise ValueError("JPEG encoding failed")
+    return buf.ravel()
+
+
+def encode_png(img):
+    success, buf = cv2.imencode(".png", img, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not success: raise ValueError("PNG encoding failed")
+    return buf.ravel()
+
+
+def read_shard(path, decode=True):
+    with np.load(path) as data:
+        shard = {k: data[k] for k in data.files}
+    if decode:
+        jpeg, offsets = shard["jpeg"], shard["offsets"]
+        shard["images"] = [cv2.imdecode(jpeg[offsets[i]:offsets[i + 1]], cv2.IMREAD_COLOR) for i in range(len(offsets) - 1)]
+    return shard
+
+
+class ShardWriter:
+    # add() only queues work: JPEG encoding runs on a thread pool (cv2 releases the
+    # GIL) and shard files are written by a single writer thread. If the disk falls
+    # behind by more than max_pending samples, new samples are dropped, never waited on.
+    def __init__(self, out_dir, shard_size=500, workers=2, quality=95, max_pending=2000, fmt="npz", lossless=False):
+        self.out_dir = out_dir
+        self.shard_size = shard_size
+        self.quality = quality
+        self.lossless = lossless # PNG instead of JPEG: bigger, but the saved pixels are exact
+        self.max_pending = max_pending
+        self.fmt = fmt # "npz" shards, or "jpg" for one file per sample (original layout)
+        self.encoders = ThreadPoolExecutor(workers)
+        self.writer = ThreadPoolExecutor(1)
+        self.buffers = {}
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.written = 0
+        self.dropped = 0
+        self.shards = 0
+        self.errors = 0
+
+    def add(self, label, img, lmList, bbox, hand_type):
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.dropped += 1
+                return False
+            self.pending += 1
+        if self.fmt == "jpg":
+            self.encoders.submit(self.write_jpg, label, img)
+            return True
+        future = self.encoders.submit(encode_png, img) if self.lossless else self.encoders.submit(encode_jpeg, img, self.quality)
+        buf = self.buffers.setdefault(label, [])
+        buf.append((future, lmList, bbox, hand_type, time.time()))
+        if len(buf) >= self.shard_size: self.flush(label)
+        return True
+
+    def flush(self, label=None):
+        for lbl in ([label] if label else list(self.buffers)):
+            samples = self.buffers.pop(lbl, [])
+            if samples: self.writer.submit(self.write_shard, lbl, samples)
+
+    def write_jpg(self, label, img):
+        try:
+            folder = os.path.join(self.out_dir, label)
+            os.makedirs(folder, exist_ok=True)
+            cv2.imwrite(os.path.join(folder, f"Image_{time.time()}.{'png' if self.lossless else 'jpg'}"), img)
+            self.done(1)
+        except Exception as e:
+            print(f"Error writing sample: {e}")
+            self.done(1, failed=True)
+
+    def write_shard(self, label, samples):
+        try:
+            blobs = [s[0].result() for s in samples]
+            offsets = np.zeros(len(blobs) + 1, np.int64)
+            offsets[1:] = np.cumsum([len(b) for b in blobs])
+            folder = os.path.join(self.out_dir, label)
+            os.makedirs(folder, exist_ok=True)
+            path = os.path.join(folder, f"shard_{time.strftime('%Y%m%d_%H%M%S')}_{self.shards:04d}.npz")
+            # Written under a temporary name so readers never see a half-written shard
+            with open(path + ".tmp", "wb") as f:
+                np.savez(f, jpeg=np.concatenate(blobs), offsets=offsets,
+                         landmarks=np.array([s[1] for s in samples], np.float32).reshape(len(samples), -1, 3),
+                         bbox=np.array([s[2] for s in samples], np.int32),
+                         hand_type=np.array([s[3] for s in samples]), ts=np.array([s[4] for s in samples]))
+            os.replace(path + ".tmp", path)
+            with self.lock: self.shards += 1
+            self.done(len(samples))
+        except Exception as e:
+            print(f"Error writing shard for {label}: {e}")
+            self.done(len(samples), failed=True)
+
+    def done(self, n, failed=False):
+        with self.lock:
+            self.pending -= n
+            if failed: self.errors += n
+            else: self.written += n
+
+    def stats(self):
+        with self.lock:
+            return {"written": self.written, "pending": self.pending, "dropped": self.dropped,
+                    "shards": self.shards, "errors": self.errors}
+
+    def close(self):
+        self.flush()
+        self.encoders.shutdown(wait=True)
+        self.writer.shutdown(wait=True)
@@ -0,0 +1,74 @@
+import cv2
+import os
+from camera import get_camera
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class VideoFileSource:
+    # Recorded session, played back as fast as it can be decoded
+    live = False
+
+    def __init__(self, path, loop=False):
+        self.path = path
+        self.loop = loop
+        self.cap = cv2.VideoCapture(path)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        success, img = self.cap.read()
+        if not success and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, img = self.cap.read()
+        return success, img
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageFolderSource:
+    # Folder of stills, e.g. Data/ or Data/<letter> from datacollection.py
+    live = False
+
+    def __init__(self, folder, loop=False):
+        self.folder = folder
+        self.loop = loop
+        self.paths = []
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(IMAGE_EXTS):
+                    self.paths.append(os.path.join(root, name))
+        self.pos = 0
+        self.current_path = None
+
+    def isOpened(self):
+        return len(self.paths) > 0
+
+    def read(self):
+        while True:
+            if self.pos >= len(self.paths):
+                if not self.loop or not self.paths: return False, None
+                self.pos = 0
+            path = self.paths[self.pos]
+            self.pos += 1
+            img = cv2.imread(path)
+            if img is not None:
+                self.current_path = path
+                return True, img
+
+    def release(self):
+        self.pos = len(self.paths)
+
+
+def open_source(spec, width=1280, height=720, loop=False, camera=None):
+    # "0" / 0 -> camera index, directory -> image folder, anything else -> video file.
+    # Cameras go through the shared, persistent CameraManager (camera.py); `camera`
+    # holds its fps / fourcc / buffer_size settings.
+    if isinstance(spec, int) or str(spec).isdigit():
+        return get_camera(int(spec), width, height, **(camera or {})).session()
+    if os.path.isdir(spec):
+        return ImageFolderSource(spec, loop=loop)
+    return VideoFileSource(spec, loop=loop)
@@ -0,0 +1,165 @@
+import itertools
+import threading
+from collections import OrderedDict
+
+
+class TrieNode:
+    __slots__ = ("children", "word", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.word = None # upper-cased key if a word ends here
+        self.top = [] # best max_k words in this subtree, best first
+
+
+class PrefixIndex:
+    # Trie over upper-cased words where every node caches its top-k completions,
+    # so search() is O(len(prefix)) no matter how big the dictionary is.
+    # Ranking: most used first, then most recently used, then insertion order.
+    # The app edits it from the Tk thread while the translator loop searches it,
+    # so every public method holds `lock`.
+    def __init__(self, words=(), max_k=10):
+        self.max_k = max_k
+        self.lock = threading.RLock()
+        self.root = TrieNode()
+        self.words = {} # key -> original spelling
+        self.freq = {}
+        self.last_used = {}
+        self.order = {}
+        self.clock = itertools.count(1)
+        self.next_order = itertools.count()
+        for word in words: self.add(word, update=False)
+        self.rebuild()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.words)
+
+    def __contains__(self, word):
+        with self.lock:
+            return word.upper() in self.words
+
+    def rank(self, key):
+        return (-self.freq[key], -self.last_used[key], self.order[key])
+
+    def path(self, key, create=False):
+        nodes = [self.root]
+        for ch in key:
+            node = nodes[-1].children.get(ch)
+            if node is None:
+                if not create: return None
+                node = nodes[-1].children[ch] = TrieNode()
+            nodes.append(node)
+        return nodes
+
+    def refresh(self, node):
+        # A node's top-k comes from its own word plus its children's top-k lists
+        candidates = [node.word] if node.word is not None else []
+        for child in node.children.values(): candidates.extend(child.top)
+        node.top = sorted(candidates, key=self.rank)[:self.max_k]
+
+    def rebuild(self):
+        def visit(node):
+            for child in node.children.values(): visit(child)
+            self.refresh(node)
+        with self.lock:
+            visit(self.root)
+
+    def add(self, word, update=True):
+        key = word.upper()
+        with self.lock:
+            if not key or key in self.words: return
+            nodes = self.path(key, create=True)
+            nodes[-1].word = key
+            self.words[key] = word
+            self.freq[key] = 0
+            self.last_used[key] = 0
+            self.order[key] = next(self.next_order)
+            if update:
+                for node in reversed(nodes): self.refresh(node)
+
+    def remove(self, word):
+        key = word.upper()
+        with self.lock:
+            nodes = self.path(key)
+            if nodes is None or nodes[-1].word is None: return
+            nodes[-1].word = None
+            del self.words[key], self.freq[key], self.last_used[key], self.order[key]
+            # Prune empty branches, then fix top-k lists bottom-up
+            for i in range(len(nodes) - 1, 0, -1):
+                if nodes[i].word is None and not nodes[i].children:
+                    del nodes[i - 1].children[key[i - 1]]
+            for node in reversed(nodes): self.refresh(node)
+
+    def touch(self, word):
+        # Record a use (typed or picked from suggestions) so it ranks higher next time
+        key = word.upper()
+        with self.lock:
+            if key not in self.words: return
+            self.freq[key] += 1
+            self.last_used[key] = next(self.clock)
+            for node in reversed(self.path(key)): self.refresh(node)
+
+    def search(self, prefix, k=3):
+        with self.lock:
+            nodes = self.path(prefix.upper())
+            if nodes is None: return []
+            return [self.words[key] for key in nodes[-1].top[:k]]
+
+
+class SpellSuggester:
+    # Runs SpellChecker.candidates on a background thread so the frame loop never
+    # waits on edit-distance search. Only the newest request is kept (older ones are
+    # superseded), and finished results are memoized per word in a small LRU.
+    def __init__(self, spell, k=3, memo_size=256):
+        self.spell = spell
+        self.k = k
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.cond = threading.Condition()
+        self.pending = None # next word for the worker
+        self.current = None # word the UI is waiting on
+        self.result = None
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def lookup(self, word):
+        with self.cond:
+            result = self.memo.get(word)
+            if result is not None: self.memo.move_to_end(word)
+            return result
+
+    def request(self, word):
+        with self.cond:
+            self.current = self.pending = word
+            self.result = None
+            self.cond.notify()
+
+    def cancel(self):
+        with self.cond:
+            self.current = self.pending = self.result = None
+
+    def poll(self):
+        # Latest completed suggestions for the current word, once; None otherwise
+        with self.cond:
+            result, self.result = self.result, None
+            return result
+
+    def compute(self, word):
+        try:
+            candidates_set = self.spell.candidates(word.lower())
+            candidates = [c.upper() for c in candidates_set] if candidates_set is not None else []
+            return candidates[:self.k]
+        except: return []
+
+    def worker(self):
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.pending is not None)
+                word, self.pending = self.pending, None
+            result = self.compute(word)
+            with self.cond:
+                self.memo[word] = result
+                self.memo.move_to_end(word)
+                while len(self.memo) > self.memo_size: self.memo.popitem(last=False)
+                if word == self.current: self.result = result
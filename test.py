@@ -1,6 +1,5 @@
 import cv2
 from cvzone.HandTrackingModule import HandDetector
-from cvzone.ClassificationModule import Classifier
 import numpy as np
 import math
 import os
@@ -8,9 +7,20 @@ import time
 import threading
 import json
 from spellchecker import SpellChecker
+from sources import open_source
+from camera import get_camera
+from pipeline import TranslatorPipeline
+from landmarks import FEATURE_SIZE, LandmarkClassifier, normalize_landmarks
+from tracking import HAND_POLICIES, HandSelector, HandTracker, ScaledDetector
+from prediction_cache import PredictionCache
+from suggestions import PrefixIndex, SpellSuggester
+from render_cache import RenderCache
+from preprocess import model_input
+from metrics import Metrics
+from presence import PresenceScheduler
 
 class SignLanguageTranslator:
-    def __init__(self):
+    def __init__(self, backend="keras", num_threads=2, shared=None):
         self.cap = None
         self.running = False
         
@@ -18,20 +28,34 @@ class SignLanguageTranslator:
         self.BASE_DIR = os.path.dirname(os.path.abspath(__file__))
         self.model_path = os.path.join(self.BASE_DIR, "Model", "keras_model.h5")
         self.labels_path = os.path.join(self.BASE_DIR, "Model", "labels.txt")
+        self.landmark_model_path = os.path.join(self.BASE_DIR, "Model", "landmark_model.npz")
+        self.tflite_model_path = os.path.join(self.BASE_DIR, "Model", "model.tflite")
         self.custom_dict_path = os.path.join(self.BASE_DIR, "custom_dict.json")
         
         # Modules
-        self.detector = HandDetector(maxHands=1)
-        try:
-            self.classifier = Classifier(self.model_path, self.labels_path)
-        except Exception as e:
-            print(f"Error loading classifier: {e}")
-            self.classifier = None
+        # The detector tracks one stream so it is always per-instance; model weights and
+        # the spell dictionary are reused from `shared` (e.g. sessions in one worker process)
+        # Detection runs on a downscaled proxy frame ("detect_scale"); crops stay full resolution
+        self.max_hands = 1
+        self.detector = ScaledDetector(HandDetector(maxHands=self.max_hands))
+        self.tracker = HandTracker(self.detector)
+        self.hand_selector = HandSelector() # which hand is signing when there are several
+        self.backend = backend # "keras", "tflite" (see convert_tflite.py)
+        self.num_threads = num_threads
+        self.classifier = None
+        self.landmark_classifier = None # loaded on demand, see load_landmark_classifier
+        if shared is not None and shared.backend == backend:
+            self.classifier = shared.classifier
+            self.landmark_classifier = shared.landmark_classifier
+        else:
+            self.load_classifier()
             
         # Spell Checker
-        self.spell = SpellChecker()
+        self.spell = shared.spell if shared is not None else SpellChecker()
+        self.spell_suggester = SpellSuggester(self.spell)
         self.suggestions = []
         self.custom_dict = []
+        self.custom_index = PrefixIndex()
         self.load_custom_dict()
         
         # Constants
@@ -48,12 +72,25 @@ class SignLanguageTranslator:
         self.stable_counter = 0
         self.auto_input_delay = 1.0 
         self.last_frame_time = time.time()
+
+        # FPS Reporting
+        self.frame_count = 0
+        self.fps = 0.0
+        self.fps_interval = 1.0
         
         # Settings Defaults
         self.mirror_mode = False
         self.dark_mode_enabled = True
         self.auto_input_enabled = True
         self.suggestion_mode = "inbuilt" # "off", "inbuilt", "custom"
+        self.classifier_type = "image" # "image", "landmarks"
+        self.pipelined = False
+        self.tracking_enabled = False
+        self.cache_enabled = True
+        self.prediction_cache = PredictionCache()
+        self.pipeline_queue_size = 1
+        self.pipeline_stats = {}
+        self.camera_config = {"fps": 30, "fourcc": "MJPG", "buffer_size": 1}
         
         # UI Metrics
         self.WINDOW_W = 1280
@@ -69,6 +106,16 @@ class SignLanguageTranslator:
         
         self.mouse_x, self.mouse_y = 0, 0
         self.mouse_click = False
+        self.render_cache = RenderCache(self.draw_circle_btn)
+
+        # Per-stage timing (off unless enabled in settings or with the 'h' HUD key)
+        self.metrics = Metrics()
+
+        # Drops to lower frame rates while no hand is in view (off unless "adaptive_rate")
+        self.presence = PresenceScheduler()
+
+        # Working images reused from frame to frame instead of allocated per frame
+        self.buffers = {}
 
     def load_custom_dict(self):
         if os.path.exists(self.custom_dict_path):
@@ -76,6 +123,55 @@ class SignLanguageTranslator:
                 with open(self.custom_dict_path, 'r') as f:
                     self.custom_dict = json.load(f)
             except: self.custom_dict = []
+        self.custom_index = PrefixIndex(self.custom_dict)
+
+    # Called by the app when the operator edits the list, keeps the index in sync
+    def add_custom_word(self, word):
+        if word not in self.custom_index:
+            self.custom_dict.append(word)
+            self.custom_index.add(word)
+
+    def remove_custom_word(self, word):
+        if word in self.custom_dict:
+            self.custom_dict.remove(word)
+            self.custom_index.remove(word)
+
+    def load_classifier(self):
+        # Imported here so the TFLite backend doesn't load Keras; it only avoids
+        # TensorFlow entirely where tflite-runtime is installed (see tflite_backend.py)
+        try:
+            if self.backend == "tflite":
+                from tflite_backend import TFLiteClassifier
+                self.classifier = TFLiteClassifier(self.tflite_model_path, self.labels_path, self.num_threads)
+            else:
+                from cvzone.ClassificationModule import Classifier
+                self.classifier = Classifier(self.model_path, self.labels_path)
+        except Exception as e:
+            print(f"Error loading classifier: {e}")
+            self.classifier = None
+
+    def load_landmark_classifier(self):
+        if self.landmark_classifier is None:
+            try:
+                self.landmark_classifier = LandmarkClassifier(self.landmark_model_path)
+            except Exception as e:
+                print(f"Error loading landmark classifier: {e}")
+        return self.landmark_classifier
+
+    def warm_up(self):
+        # One throwaway pass through each model so the first real frame doesn't pay
+        # for MediaPipe graph setup, TF/TFLite first-call tracing or dictionary lookups
+        try:
+            self.detector.findHands(np.zeros((self.WINDOW_H, self.WINDOW_W, 3), np.uint8), draw=False)
+            if self.classifier:
+                data = self.model_input_buffer()
+                data.fill(1.0) # a blank white crop; the buffer is uninitialised until then
+                self.predict_input(data)
+            if self.landmark_classifier:
+                self.landmark_classifier.predict(np.zeros((1, FEATURE_SIZE), np.float32))
+            self.spell_suggester.compute("HELO")
+        except Exception as e:
+            print(f"Error warming up models: {e}")
 
     def configure(self, settings):
         self.mirror_mode = settings.get("mirror", False)
@@ -83,8 +179,43 @@ class SignLanguageTranslator:
         self.auto_input_enabled = settings.get("auto_input", True)
         self.suggestion_mode = settings.get("suggestion_mode", "inbuilt")
         self.auto_input_delay = settings.get("stability_time", 1.0)
+        self.pipelined = settings.get("pipelined", False)
+        self.classifier_type = settings.get("classifier", "image")
+        self.detector.scale = settings.get("detect_scale", 1.0)
+        max_hands = settings.get("max_hands", 2 if settings.get("two_hands", False) else 1)
+        if max_hands != self.max_hands:
+            self.max_hands = max_hands
+            self.detector.detector = HandDetector(maxHands=max_hands)
+        self.hand_selector.policy = settings.get("hand_policy", "largest")
+        self.hand_selector.dominant = settings.get("dominant_hand", "Right")
+        self.hand_selector.reset()
+        self.tracking_enabled = settings.get("tracking", False)
+        self.tracker.detect_every = settings.get("detect_every", self.tracker.detect_every)
+        self.tracker.reset()
+        self.cache_enabled = settings.get("prediction_cache", True)
+        self.prediction_cache.ttl = settings.get("cache_ttl", self.prediction_cache.ttl)
+        self.prediction_cache.clear()
+        backend = settings.get("backend", self.backend)
+        num_threads = settings.get("tflite_threads", self.num_threads)
+        if backend != self.backend or (backend == "tflite" and num_threads != self.num_threads):
+            self.backend, self.num_threads = backend, num_threads
+            self.load_classifier()
+        if self.classifier_type == "landmarks" and self.load_landmark_classifier() is None:
+            self.classifier_type = "image"
+        self.metrics.configure(settings.get("metrics", False), settings.get("metrics_file"), settings.get("metrics_interval"),
+                               settings.get("debug_alloc", False))
+        self.presence.enabled = settings.get("adaptive_rate", False)
+        self.presence.standby_after = settings.get("standby_after", self.presence.standby_after)
+        self.presence.idle_after = settings.get("idle_after", self.presence.idle_after)
+        self.camera_config = {"fps": settings.get("camera_fps", 30), "fourcc": settings.get("camera_fourcc", "MJPG"),
+                              "buffer_size": settings.get("camera_buffer", 1)}
 
     def update_suggestions(self):
+        with self.metrics.stage("suggestions"):
+            self.compute_suggestions()
+
+    def compute_suggestions(self):
+        self.spell_suggester.cancel()
         if self.suggestion_mode == "off":
             self.suggestions = []
             return
@@ -101,18 +232,22 @@ class SignLanguageTranslator:
             
         if self.suggestion_mode == "custom":
             # Match start of word in custom dict
-            matches = [w for w in self.custom_dict if w.upper().startswith(current_word)]
-            self.suggestions = matches[:3]
+            self.suggestions = self.custom_index.search(current_word, 3)
         else: # inbuilt
             if len(current_word) < 2:
                 self.suggestions = []
                 return
-            try:
-                candidates_set = self.spell.candidates(current_word.lower())
-                candidates = [c.upper() for c in candidates_set] if candidates_set is not None else []
-                self.suggestions = candidates[:3]
-            except:
+            # Memo hit is instant, otherwise the worker fills it in (see poll_suggestions)
+            cached = self.spell_suggester.lookup(current_word)
+            if cached is not None:
+                self.suggestions = cached
+            else:
                 self.suggestions = []
+                self.spell_suggester.request(current_word)
+
+    def poll_suggestions(self):
+        result = self.spell_suggester.poll()
+        if result is not None: self.suggestions = result
 
     def mouse_event(self, event, x, y, flags, param):
         self.mouse_x, self.mouse_y = x, y
@@ -145,194 +280,359 @@ class SignLanguageTranslator:
             cv2.line(img, (cx-10, cy+5), (cx-10, cy), white, thick, cv2.LINE_AA)
             cv2.line(img, (cx+10, cy+5), (cx+10, cy), white, thick, cv2.LINE_AA)
 
-    def run(self):
-        self.running = True
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.WINDOW_W)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.WINDOW_H)
+    def buffer(self, name, shape, dtype=np.uint8):
+        # Named scratch array, reallocated only when the frame size changes.
+        # Each name must only be used from one thread.
+        buf = self.buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self.buffers[name] = np.empty(shape, dtype)
+        return buf
+
+    def model_input_buffer(self, n=1):
+        # (n, H, W, 3) float32 input batch for the image model; cvzone's Classifier
+        # already keeps a single-image one (.data), anything else comes from self.buffer
+        if hasattr(self.classifier, "interpreter"):
+            return self.buffer(f"model_input_{n}", (n, self.classifier.input_h, self.classifier.input_w, 3), np.float32)
+        if n == 1: return self.classifier.data
+        return self.buffer(f"model_input_{n}", (n,) + self.classifier.data.shape[1:], np.float32)
+
+    def predict_input(self, data):
+        # Runs the image model on an already normalised input tensor -> scores
+        if hasattr(self.classifier, "interpreter"): return self.classifier.predict(self.classifier.quantize(data))
+        return self.classifier.model(data, training=False).numpy()
+
+    def classify_crops(self, img, hands):
+        # Crop, letterbox, resize and normalise every hand straight into one input batch
+        # and run the image model once for all of them -> [(prediction, index) or None per hand]
+        results = [None] * len(hands)
+        if not self.classifier or not hands: return results
+        try:
+            with self.metrics.stage("preprocess"):
+                data = self.model_input_buffer(len(hands))
+                canvas = self.buffer("canvas", data.shape[1:])
+                rows = [i for i, hand in enumerate(hands)
+                        if model_input(img, hand['bbox'], data[i], self.offset, self.imgSize, canvas) is not None]
+            if rows:
+                with self.metrics.stage("classify"):
+                    predictions = self.predict_input(data)
+                for i in rows: results[i] = (list(predictions[i]), int(np.argmax(predictions[i])))
+        except: pass
+        return results
+
+    def classify_crop(self, img, hand):
+        return self.classify_crops(img, [hand])[0]
+
+    def classify_hands(self, img, hands):
+        # Held poses hit the cache and skip the crop + CNN entirely; the rest share one batch
+        keys = [self.prediction_cache.key(hand) if self.cache_enabled else None for hand in hands]
+        results = [self.prediction_cache.get(key) if key is not None else None for key in keys]
+        todo = [i for i, result in enumerate(results) if result is None]
+        if todo:
+            for i, result in zip(todo, self.classify_crops(img, [hands[i] for i in todo])):
+                results[i] = result
+                if result is not None: self.prediction_cache.put(keys[i], result)
+        return results
+
+    def classify_landmarks(self, hands):
+        # 21 landmarks per hand -> tiny MLP, one call for all hands, no crops needed
+        results = [None] * len(hands)
+        vectors = [normalize_landmarks(hand['lmList'], hand.get('type', "Right")) for hand in hands]
+        rows = [i for i, vec in enumerate(vectors) if vec is not None]
+        if rows:
+            probs = self.landmark_classifier.predict(np.stack([vectors[i] for i in rows]))
+            for i, p in zip(rows, probs): results[i] = (list(p), int(np.argmax(p)))
+        return results
+
+    def detect_and_classify(self, img):
+        # Pure per-frame work, safe to run off the UI thread (no text state touched)
+        # 1. Detection (no drawing, so 'img' stays clean for cropping without a copy)
+        finder = self.tracker if self.tracking_enabled else self.detector
+        with self.metrics.stage("detect"):
+            hands = finder.findHands(img, draw=False)
+        if not hands: return hands, ""
+
+        # 2. Every hand is classified; each gets its own "letter"
+        if self.classifier_type == "landmarks":
+            results, labels = self.classify_landmarks(hands), self.landmark_classifier.labels
+        else:
+            results, labels = self.classify_hands(img, hands), self.labels
+        for hand, result in zip(hands, results):
+            hand["letter"] = labels[result[1]] if result is not None and 0 <= result[1] < len(labels) else ""
+
+        # 3. The signing hand (see HandSelector) goes first and is the one that types
+        i = self.hand_selector.select(hands, [r[0] if r is not None else None for r in results])
+        hands = [hands[i]] + hands[:i] + hands[i + 1:]
+        return hands, hands[0]["letter"]
+
+    def update_auto_input(self):
+        # 2. Auto-Input Logic
+        if self.auto_input_enabled:
+            if self.current_letter and self.current_letter == self.last_detected_letter:
+                self.stable_counter += (time.time() - self.last_frame_time)
+                if self.stable_counter >= self.auto_input_delay:
+                    self.final_text += self.current_letter
+                    self.stable_counter = 0
+                    self.update_suggestions()
+            else:
+                self.last_detected_letter = self.current_letter
+                self.stable_counter = 0
         
-        window_name = "SignBridge Translator"
-        cv2.namedWindow(window_name)
-        cv2.setMouseCallback(window_name, self.mouse_event)
+        self.last_frame_time = time.time()
+
+    def process_frame(self, img):
+        hands, self.current_letter = self.detect_and_classify(img)
+        self.update_auto_input()
+        return hands
+
+    def idle_frame(self, img):
+        # Idle mode: only look for a hand, on a smaller proxy than usual. The frame
+        # where one shows up already gets the full pipeline.
+        with self.metrics.stage("detect"):
+            found = self.detector.findHands(img, draw=False, scale=min(self.detector.scale, self.presence.idle_scale))
+        if found: return self.process_frame(img)
+        self.current_letter = ""
+        self.update_auto_input()
+        return []
+
+    def update_presence(self, hands, frame_start):
+        if self.presence.update(bool(hands)):
+            # Below full rate the camera only decodes the frames the loop actually reads
+            if hasattr(self.cap, "set_low_power"): self.cap.set_low_power(self.presence.mode != "active")
+            if self.presence.mode == "idle":
+                # Stale tracking / cached predictions are no use after a long gap
+                self.tracker.reset()
+                self.prediction_cache.clear()
+                self.hand_selector.reset()
+        if self.metrics.enabled:
+            self.metrics.set_gauge("mode", self.presence.mode)
+            self.metrics.set_gauge("duty", f"{self.presence.duty_cycle():.0%}")
+        self.presence.throttle(frame_start)
+
+    def draw_ui(self, imgOutput, hands):
+        h, w, _ = imgOutput.shape
+        sidebar_w = 320
+        sidebar_x = w - sidebar_w
+        bg_color = (15, 15, 20) if self.dark_mode_enabled else (255, 255, 255)
+        txt_color = (255, 255, 255) if self.dark_mode_enabled else (20, 20, 20)
+
+        # Blend only the sidebar ROI and stamp the cached text layer (re-rendered on text change)
+        self.render_cache.draw_sidebar(imgOutput, bg_color, txt_color, self.final_text, self.suggestions, self.suggestion_mode)
+
+        if self.auto_input_enabled and self.current_letter:
+            progress = min(self.stable_counter / self.auto_input_delay, 1.0)
+            px, py = sidebar_x + 20, h - 140
+            cv2.rectangle(imgOutput, (px, py), (px + 280, py + 8), (40, 40, 40), -1)
+            cv2.rectangle(imgOutput, (px, py), (px + int(280 * progress), py + 8), (56, 189, 248), -1)
+            cv2.putText(imgOutput, f"Auto-typing: {self.current_letter}", (px, py - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
+
+        for hand in hands[1:]:
+            # Other hands: outline and their own prediction, greyed out
+            bx, by, bbw, bbh = hand['bbox']
+            cv2.rectangle(imgOutput, (bx, by), (bx + bbw, by + bbh), (120, 120, 120), 1)
+            if hand.get("letter"):
+                cv2.putText(imgOutput, hand["letter"], (bx + 5, by - 8), cv2.FONT_HERSHEY_DUPLEX, 0.6, (160, 160, 160), 1)
+
+        if hands:
+            hand = hands[0]
+            bx, by, bbw, bbh = hand['bbox']
+            cv2.rectangle(imgOutput, (bx, by), (bx + bbw, by + bbh), (56, 189, 248), 2)
+            if self.current_letter:
+                cv2.rectangle(imgOutput, (bx, by - 35), (bx + 80, by), (56, 189, 248), -1)
+                cv2.putText(imgOutput, self.current_letter, (bx + 10, by - 10), cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 255, 255), 2)
+
+        video_area_w = w - sidebar_w
+        v_center = video_area_w // 2
+        bar_y = h - 100
         
-        while self.running:
-            success, img = self.cap.read()
-            if not success: break
-            if self.mirror_mode: img = cv2.flip(img, 1)
-
-            imgOutput = img.copy()
-            h, w, _ = img.shape
-            # 1. Detection (Run on a copy to keep 'img' clean for cropping)
-            imgDetection_for_bbox = img.copy()
-            hands, _ = self.detector.findHands(imgDetection_for_bbox, draw=True)
-            self.current_letter = ""
-
-            if hands:
-                hand = hands[0]
-                x, y, bw, bh = hand['bbox']
-                
-                # Accuracy Fix: ALWAYS crop from the CLEAN image (no skeleton)
-                x1, y1 = max(0, x - self.offset), max(0, y - self.offset)
-                x2, y2 = min(w, x + bw + self.offset), min(h, y + bh + self.offset)
-                imgCrop = img[y1:y2, x1:x2]
-
-                if imgCrop.size != 0:
-                    imgWhite = np.ones((self.imgSize, self.imgSize, 3), np.uint8) * 255
-                    aspectRatio = bh / bw
-                    try:
-                        if aspectRatio > 1:
-                            k = self.imgSize / bh
-                            wCal = math.ceil(k * bw)
-                            imgResize = cv2.resize(imgCrop, (wCal, self.imgSize))
-                            wGap = (self.imgSize - wCal) // 2
-                            imgWhite[:, wGap:wGap + wCal] = imgResize
-                        else:
-                            k = self.imgSize / bw
-                            hCal = math.ceil(k * bh)
-                            imgResize = cv2.resize(imgCrop, (self.imgSize, hCal))
-                            hGap = (self.imgSize - hCal) // 2
-                            imgWhite[hGap:hGap + hCal, :] = imgResize
-
-                        if self.classifier:
-                            prediction, index = self.classifier.getPrediction(imgWhite, draw=False)
-                            if index < len(self.labels):
-                                self.current_letter = self.labels[index]
-                    except: pass
-            
-            # 2. Auto-Input Logic
-            if self.auto_input_enabled:
-                if self.current_letter and self.current_letter == self.last_detected_letter:
-                    self.stable_counter += (time.time() - self.last_frame_time)
-                    if self.stable_counter >= self.auto_input_delay:
-                        self.final_text += self.current_letter
-                        self.stable_counter = 0
-                        self.update_suggestions()
-                else:
-                    self.last_detected_letter = self.current_letter
-                    self.stable_counter = 0
-            
-            self.last_frame_time = time.time()
+        btn_defs = [
+            {"name": "back",   "x": v_center - 110, "color": self.CLR_BTN_NORMAL, "icon": "back", "label": "Back"},
+            {"name": "space",  "x": v_center - 35,  "color": self.CLR_BTN_NORMAL, "icon": "space", "label": "Space"},
+            {"name": "hangup", "x": v_center + 35,  "color": self.CLR_RED,        "icon": "hangup", "label": "End"}, 
+            {"name": "clear",  "x": v_center + 110, "color": self.CLR_BTN_NORMAL, "icon": "clear", "label": "Clear"},
+        ]
+        
+        for b in btn_defs:
+            dist = math.hypot(self.mouse_x - b["x"], self.mouse_y - (bar_y + 40))
+            is_hover = dist < 28
+            self.render_cache.draw_button(imgOutput, (b["x"], bar_y + 40), 28, b["color"], b["icon"], b["label"], is_hover)
+            if self.mouse_click and is_hover:
+                if b["name"] == "back": self.final_text = self.final_text[:-1]
+                elif b["name"] == "space": self.final_text += " "; self.update_suggestions()
+                elif b["name"] == "clear": self.final_text = ""
+                elif b["name"] == "hangup": self.running = False
+        
+        self.mouse_click = False
 
-            # --- UI DRAWING ---
-            sidebar_w = 320
-            sidebar_x = w - sidebar_w
-            bg_color = (15, 15, 20) if self.dark_mode_enabled else (255, 255, 255)
-            txt_color = (255, 255, 255) if self.dark_mode_enabled else (20, 20, 20)
+    def handle_key(self, key):
+        if key == 32 and self.current_letter: 
+            self.final_text += self.current_letter
+            self.update_suggestions()
+        elif key in [ord('1'), ord('2'), ord('3')] and self.suggestions:
+            idx = key - ord('1')
+            if idx < len(self.suggestions):
+                words = self.final_text.split()
+                if words:
+                    words[-1] = self.suggestions[idx]
+                    self.final_text = " ".join(words) + " "
+                    if self.suggestion_mode == "custom": self.custom_index.touch(words[-1])
+                    self.suggestions = []
+                    # A spell-check still running for the replaced word must not bring its candidates back
+                    self.spell_suggester.cancel()
+        elif key == ord('h'): self.metrics.toggle_hud()
+        elif key == ord('q'): self.running = False
 
-            overlay = imgOutput.copy()
-            cv2.rectangle(overlay, (sidebar_x, 0), (w, h), bg_color, -1)
-            cv2.addWeighted(overlay, 0.9, imgOutput, 0.1, 0, imgOutput)
-            
-            cv2.putText(imgOutput, "TRANSLATION", (sidebar_x + 20, 40), cv2.FONT_HERSHEY_DUPLEX, 0.6, (56, 189, 248), 1)
-            cv2.line(imgOutput, (sidebar_x + 20, 55), (w - 20, 55), (80, 80, 80), 1)
-            
-            # Suggestions List (Visual UI)
-            if self.suggestions:
-                cv2.putText(imgOutput, f"SUGGESTIONS ({self.suggestion_mode.upper()}):", (sidebar_x + 20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
-                for i, sugg in enumerate(self.suggestions):
-                    cv2.putText(imgOutput, f"[{i+1}] {sugg}", (sidebar_x + 20, 105 + (i * 25)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (56, 189, 248), 1)
-
-            # --- TRANSCRIPT RENDERING ---
-            text_y = 210
-            words = self.final_text.split()
-            
-            # Ghost Text Logic: Show the top suggestion at the end of the text
-            render_text = self.final_text
-            ghost_sugg = ""
-            if self.suggestion_mode != "off" and self.suggestions and len(words) > 0:
-                current_word = words[-1]
-                top_sugg = self.suggestions[0]
-                # If suggestion is longer than current word, show the remainder
-                if top_sugg.upper().startswith(current_word.upper()):
-                    ghost_sugg = top_sugg[len(current_word):]
-
-            # Wrapping & Rendering
-            display_lines = []
-            curr_line = ""
-            # We process words normally
-            for word in words:
-                (tw, _), _ = cv2.getTextSize(curr_line + word + " ", cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
-                if tw > sidebar_w - 40:
-                    display_lines.append(curr_line)
-                    curr_line = word + " "
-                else:
-                    curr_line += word + " "
-            
-            # Handle the last line (with potential ghost text)
-            display_lines.append(curr_line)
-            
-            for i, line in enumerate(display_lines[-15:]):
-                is_last_line = (i == len(display_lines[-15:]) - 1)
-                cv2.putText(imgOutput, line, (sidebar_x + 20, text_y + (i * 28)), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, txt_color, 1, cv2.LINE_AA)
-                
-                # If it's the last line and we have a suggestion, draw it in Accent color
-                if is_last_line and ghost_sugg:
-                    (line_w, _), _ = cv2.getTextSize(line, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
-                    # Draw ghost text in a faded accent color
-                    cv2.putText(imgOutput, ghost_sugg, (sidebar_x + 20 + line_w, text_y + (i * 28)), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (150, 150, 150), 1, cv2.LINE_AA)
-
-            if self.auto_input_enabled and self.current_letter:
-                progress = min(self.stable_counter / self.auto_input_delay, 1.0)
-                px, py = sidebar_x + 20, h - 140
-                cv2.rectangle(imgOutput, (px, py), (px + 280, py + 8), (40, 40, 40), -1)
-                cv2.rectangle(imgOutput, (px, py), (px + int(280 * progress), py + 8), (56, 189, 248), -1)
-                cv2.putText(imgOutput, f"Auto-typing: {self.current_letter}", (px, py - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
-
-            if hands:
-                hand = hands[0]
-                bx, by, bbw, bbh = hand['bbox']
-                cv2.rectangle(imgOutput, (bx, by), (bx + bbw, by + bbh), (56, 189, 248), 2)
-                if self.current_letter:
-                    cv2.rectangle(imgOutput, (bx, by - 35), (bx + 80, by), (56, 189, 248), -1)
-                    cv2.putText(imgOutput, self.current_letter, (bx + 10, by - 10), cv2.FONT_HERSHEY_DUPLEX, 0.8, (255, 255, 255), 2)
-
-            video_area_w = w - sidebar_w
-            v_center = video_area_w // 2
-            bar_y = h - 100
-            
-            btn_defs = [
-                {"name": "back",   "x": v_center - 110, "color": self.CLR_BTN_NORMAL, "icon": "back", "label": "Back"},
-                {"name": "space",  "x": v_center - 35,  "color": self.CLR_BTN_NORMAL, "icon": "space", "label": "Space"},
-                {"name": "hangup", "x": v_center + 35,  "color": self.CLR_RED,        "icon": "hangup", "label": "End"}, 
-                {"name": "clear",  "x": v_center + 110, "color": self.CLR_BTN_NORMAL, "icon": "clear", "label": "Clear"},
-            ]
-            
-            for b in btn_defs:
-                dist = math.hypot(self.mouse_x - b["x"], self.mouse_y - (bar_y + 40))
-                is_hover = dist < 28
-                self.draw_circle_btn(imgOutput, (b["x"], bar_y + 40), 28, b["color"], b["icon"], is_hover)
-                cv2.putText(imgOutput, b["label"], (b["x"] - 25, bar_y + 85), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
-                if self.mouse_click and is_hover:
-                    if b["name"] == "back": self.final_text = self.final_text[:-1]
-                    elif b["name"] == "space": self.final_text += " "; self.update_suggestions()
-                    elif b["name"] == "clear": self.final_text = ""
-                    elif b["name"] == "hangup": self.running = False
-            
-            self.mouse_click = False
-            key = cv2.waitKey(1) & 0xFF
-            if key == 32 and self.current_letter: 
-                self.final_text += self.current_letter
-                self.update_suggestions()
-            elif key in [ord('1'), ord('2'), ord('3')] and self.suggestions:
-                idx = key - ord('1')
-                if idx < len(self.suggestions):
-                    words = self.final_text.split()
-                    if words:
-                        words[-1] = self.suggestions[idx]
-                        self.final_text = " ".join(words) + " "
-                        self.suggestions = []
-            elif key == ord('q'): self.running = False
+    def update_fps(self, headless, dropped=None):
+        self.frame_count += 1
+        self.metrics.frame_done(self.fps, dropped)
+        now = time.time()
+        elapsed = now - self.fps_window_start
+        if elapsed >= self.fps_interval:
+            self.fps = (self.frame_count - self.fps_window_frames) / elapsed
+            self.fps_window_start = now
+            self.fps_window_frames = self.frame_count
+            if headless:
+                print(f"FPS: {self.fps:.1f} ({self.frame_count} frames)")
+
+    def render_frame(self, window_name, img, hands):
+        imgOutput = self.buffer("output", img.shape)
+        np.copyto(imgOutput, img)
+        self.poll_suggestions()
+
+        # --- UI DRAWING ---
+        with self.metrics.stage("draw"):
+            self.draw_ui(imgOutput, hands)
+            self.metrics.draw_hud(imgOutput)
+        with self.metrics.stage("display"):
+            self.handle_key(cv2.waitKey(1) & 0xFF)
             
             cv2.imshow(window_name, imgOutput)
             if cv2.getWindowProperty(window_name, cv2.WND_PROP_VISIBLE) < 1: self.running = False
 
+    def run_sequential(self, window_name, headless, max_frames):
+        while self.running:
+            frame_start = time.perf_counter()
+            self.metrics.frame_begin()
+            with self.metrics.stage("capture"):
+                success, img = self.cap.read()
+            if not success: break
+            if self.mirror_mode: img = cv2.flip(img, 1, dst=self.buffer("mirror", img.shape))
+
+            if self.presence.enabled and self.presence.mode == "idle": hands = self.idle_frame(img)
+            else: hands = self.process_frame(img)
+            # Headless: detection + classification only, no window or drawing work
+            if not headless:
+                self.render_frame(window_name, img, hands)
+            if self.metrics.enabled: self.metrics.add("frame", time.perf_counter() - frame_start)
+            if self.presence.enabled: self.update_presence(hands, frame_start)
+            self.update_fps(headless)
+            if max_frames and self.frame_count >= max_frames: break
+
+    def run_pipelined(self, window_name, headless, max_frames):
+        # Capture and inference on worker threads; this thread only renders the
+        # newest frame with the newest result, so slow inference never blocks the UI
+        pipeline = TranslatorPipeline(self, self.cap, self.pipeline_queue_size, render=not headless)
+        pipeline.start()
+        last_seq = -1
+        try:
+            while self.running:
+                frame_start = time.perf_counter()
+                self.metrics.frame_begin()
+                if headless:
+                    result = pipeline.wait_result(last_seq)
+                    if result is None:
+                        if pipeline.finished(): break
+                        continue
+                    last_seq, hands, self.current_letter = result
+                    self.update_auto_input()
+                else:
+                    frame = pipeline.next_frame()
+                    if frame is None:
+                        if pipeline.finished(): break
+                        continue
+                    seq, ts, img = frame
+                    last_seq, hands, self.current_letter = pipeline.latest_result()
+                    self.update_auto_input()
+                    self.render_frame(window_name, img, hands)
+                if self.metrics.enabled: self.metrics.add("frame", time.perf_counter() - frame_start)
+                self.update_fps(headless, pipeline.dropped())
+                if max_frames and self.frame_count >= max_frames: break
+        finally:
+            pipeline.stop()
+        self.pipeline_stats = {"captured": pipeline.captured, "inferred": pipeline.inferred, "dropped": pipeline.dropped()}
+
+    def run(self, source=None, headless=False, max_frames=None, pipelined=None):
+        self.running = True
+        # The default camera stays open between runs (see camera.py)
+        self.cap = source if source is not None else get_camera(0, self.WINDOW_W, self.WINDOW_H, **self.camera_config).session()
+        if pipelined is None: pipelined = self.pipelined
+        
+        window_name = "SignBridge Translator"
+        if not headless:
+            cv2.namedWindow(window_name)
+            cv2.setMouseCallback(window_name, self.mouse_event)
+
+        # FPS Reporting
+        self.frame_count = 0
+        self.fps = 0.0
+        self.fps_window_frames = 0
+        run_start = self.fps_window_start = time.time()
+        self.presence.reset()
+
+        if pipelined: self.run_pipelined(window_name, headless, max_frames)
+        else: self.run_sequential(window_name, headless, max_frames)
+
         self.cap.release()
-        cv2.destroyAllWindows()
+        if headless:
+            total = time.time() - run_start
+            avg = self.frame_count / total if total > 0 else 0.0
+            print(f"Processed {self.frame_count} frames in {total:.2f}s ({avg:.1f} FPS)")
+            if pipelined: print(f"Pipeline: {self.pipeline_stats}")
+            if self.tracking_enabled: print(f"Tracking: {self.tracker.stats()}")
+            if self.cache_enabled: print(f"Prediction cache: {self.prediction_cache.stats()}")
+            if hasattr(self.cap, "stats"): print(f"Camera: {self.cap.stats()}")
+            if self.presence.enabled: print(f"Presence: {self.presence.stats()}")
+            if self.metrics.debug_alloc: print(f"Allocated per frame: {self.metrics.gauges.get('alloc_kb')} KB (last frame peak)")
+        else:
+            cv2.destroyAllWindows()
+        if self.metrics.jsonl_path: self.metrics.export()
         self.running = False
 
     def stop(self): self.running = False
 
 if __name__ == "__main__":
-    SignLanguageTranslator().run()
+    import argparse
+    parser = argparse.ArgumentParser(description="SignBridge translator")
+    parser.add_argument("--source", default="0", help="camera index, video file or image folder (e.g. Data/A)")
+    parser.add_argument("--headless", action="store_true", help="no window or drawing, just report FPS")
+    parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument("--loop", action="store_true", help="loop video / image folder sources")
+    parser.add_argument("--pipelined", action="store_true", help="run capture and inference on worker threads")
+    parser.add_argument("--classifier", choices=["image", "landmarks"], default="image")
+    parser.add_argument("--backend", choices=["keras", "tflite"], default="keras", help="image model runtime")
+    parser.add_argument("--threads", type=int, default=2, help="TFLite interpreter threads")
+    parser.add_argument("--metrics", metavar="FILE", help="append per-stage timing percentiles to FILE (JSONL)")
+    parser.add_argument("--track", type=int, default=0, metavar="N", help="full hand detection only every N frames, track in between")
+    parser.add_argument("--detect-scale", type=float, default=1.0, help="run hand detection on a frame downscaled by this factor")
+    parser.add_argument("--max-hands", type=int, default=1, help="hands to detect and classify (one batched model call)")
+    parser.add_argument("--hand-policy", choices=HAND_POLICIES, default="largest", help="how the signing hand is picked")
+    parser.add_argument("--adaptive", action="store_true", help="lower the frame rate while no hand is in view")
+    parser.add_argument("--debug-alloc", action="store_true", help="report memory allocated per frame (tracemalloc, slow)")
+    parser.add_argument("--capture-process", action="store_true", help="capture in a separate process, frames shared through a shared-memory ring")
+    args = parser.parse_args()
+
+    app = SignLanguageTranslator(backend=args.backend, num_threads=args.threads)
+    app.configure({"classifier": args.classifier, "pipelined": args.pipelined, "tracking": args.track > 0, "detect_every": max(args.track, 1), "detect_scale": args.detect_scale, "max_hands": args.max_hands, "hand_policy": args.hand_policy, "metrics_file": args.metrics, "adaptive_rate": args.adaptive, "debug_alloc": args.debug_alloc})
+    if args.capture_process:
+        from frame_ring import RingCapture
+        capture = RingCapture(args.source, (app.WINDOW_H, app.WINDOW_W, 3), loop=args.loop).start()
+        try:
+            # Copies: a frame is used for the whole loop iteration (longer still in idle
+            # mode), and a zero-copy view could be overwritten by the writer meanwhile.
+            # Pipelined, a frame can sit in both queues and in both worker threads, and
+            # one more is being read, so the copy buffers must outnumber all of those
+            buffers = 2 * app.pipeline_queue_size + 3 if args.pipelined else 2
+            app.run(capture.source(copy=True, buffers=buffers), headless=args.headless, max_frames=args.max_frames, pipelined=args.pipelined)
+        finally:
+            capture.stop()
+    else:
+        app.run(open_source(args.source, app.WINDOW_W, app.WINDOW_H, loop=args.loop, camera=app.camera_config), headless=args.headless, max_frames=args.max_frames, pipelined=args.pipelined)
@@ -0,0 +1,61 @@
+import cv2
+import numpy as np
+
+try:
+    # Small standalone runtime (requirements.txt installs it on Linux); elsewhere there
+    # is no wheel and this falls back to the interpreter bundled with TensorFlow
+    from tflite_runtime.interpreter import Interpreter
+except ImportError:
+    from tensorflow.lite.python.interpreter import Interpreter
+
+
+class TFLiteClassifier:
+    # Drop-in replacement for cvzone's Classifier backed by a (quantized) .tflite model
+    def __init__(self, modelPath, labelsPath=None, num_threads=2):
+        self.interpreter = Interpreter(model_path=modelPath, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input_details = self.interpreter.get_input_details()[0]
+        self.output_details = self.interpreter.get_output_details()[0]
+        self.input_index = self.input_details["index"]
+        self.output_index = self.output_details["index"]
+        _, self.input_h, self.input_w, _ = self.input_details["shape"]
+        self.input_dtype = self.input_details["dtype"]
+        self.input_scale, self.input_zero = self.input_details["quantization"]
+        self.output_scale, self.output_zero = self.output_details["quantization"]
+
+        self.list_labels = []
+        if labelsPath:
+            with open(labelsPath, "r") as f:
+                self.list_labels = [line.strip() for line in f if line.strip()]
+
+    def preprocess(self, img):
+        # Same normalisation as cvzone: resize to the model input, scale to [-1, 1]
+        imgS = cv2.resize(img, (self.input_w, self.input_h))
+        return self.quantize((imgS.astype(np.float32) / 127.0) - 1)
+
+    def quantize(self, data):
+        # Float input in [-1, 1] -> the model's input type (unchanged for float models)
+        if self.input_dtype == np.float32: return data
+        data = np.round(data / self.input_scale + self.input_zero)
+        info = np.iinfo(self.input_dtype)
+        return np.clip(data, info.min, info.max).astype(self.input_dtype)
+
+    def predict(self, batch):
+        # batch: (N, H, W, 3) already preprocessed -> (N, num_classes) float scores
+        if self.input_details["shape"][0] != len(batch):
+            self.interpreter.resize_tensor_input(self.input_index, [len(batch), self.input_h, self.input_w, 3])
+            self.interpreter.allocate_tensors()
+            self.input_details = self.interpreter.get_input_details()[0]
+        self.interpreter.set_tensor(self.input_index, batch)
+        self.interpreter.invoke()
+        output = self.interpreter.get_tensor(self.output_index)
+        if self.output_details["dtype"] != np.float32:
+            output = (output.astype(np.float32) - self.output_zero) * self.output_scale
+        return output
+
+    def getPrediction(self, img, draw=True, pos=(50, 50), scale=2, color=(0, 255, 0)):
+        prediction = self.predict(self.preprocess(img)[None])
+        indexVal = int(np.argmax(prediction[0]))
+        if draw and self.list_labels:
+            cv2.putText(img, str(self.list_labels[indexVal]), pos, cv2.FONT_HERSHEY_COMPLEX, scale, color, 2)
+        return list(prediction[0]), indexVal
@@ -0,0 +1,164 @@
+import cv2
+import numpy as np
+
+
+def hand_from_landmarks(lmList, hand_type):
+    # Same dict cvzone's HandDetector.findHands builds
+    xs = [p[0] for p in lmList]
+    ys = [p[1] for p in lmList]
+    xmin, xmax, ymin, ymax = min(xs), max(xs), min(ys), max(ys)
+    bbox = xmin, ymin, xmax - xmin, ymax - ymin
+    return {"lmList": lmList, "bbox": bbox, "center": (bbox[0] + bbox[2] // 2, bbox[1] + bbox[3] // 2), "type": hand_type}
+
+
+HAND_POLICIES = ("largest", "dominant", "continuity", "confident")
+
+
+class HandSelector:
+    # Picks the signing hand when more than one is detected:
+    #   largest     biggest bbox (usually the person nearest the camera)
+    #   dominant    the `dominant` ("Right" / "Left") hand, else the largest
+    #   continuity  the hand nearest to the one picked last frame, else the largest
+    #   confident   the hand whose prediction has the highest score (needs scores)
+    def __init__(self, policy="largest", dominant="Right"):
+        self.policy = policy
+        self.dominant = dominant
+        self.last_center = None
+
+    def reset(self):
+        self.last_center = None
+
+    def select(self, hands, scores=None):
+        # Index into hands, or None if there are none
+        if not hands: return None
+        largest = max(range(len(hands)), key=lambda i: hands[i]["bbox"][2] * hands[i]["bbox"][3])
+        index = largest
+        if self.policy == "dominant":
+            matches = [i for i, h in enumerate(hands) if h["type"] == self.dominant]
+            if matches: index = max(matches, key=lambda i: hands[i]["bbox"][2] * hands[i]["bbox"][3])
+        elif self.policy == "continuity" and self.last_center is not None:
+            lx, ly = self.last_center
+            index = min(range(len(hands)), key=lambda i: (hands[i]["center"][0] - lx) ** 2 + (hands[i]["center"][1] - ly) ** 2)
+        elif self.policy == "confident" and scores is not None:
+            best = [max(s) if s is not None else -1 for s in scores]
+            if max(best) >= 0: index = best.index(max(best))
+        self.last_center = hands[index]["center"]
+        return index
+
+
+class ScaledDetector:
+    # Wraps a HandDetector and runs it on a proxy of the frame downscaled by `scale`.
+    # Landmarks (and so bbox / center) are mapped back to full-resolution coordinates,
+    # so crops are still cut from the full frame. The proxy is never shrunk below
+    # `min_height` rows, which keeps small inputs such as tracker ROIs usable.
+    def __init__(self, detector, scale=1.0, min_height=240):
+        self.detector = detector
+        self.scale = scale
+        self.min_height = min_height
+        self.proxy = None
+
+    def findHands(self, img, draw=True, flipType=True, scale=None):
+        h, w = img.shape[:2]
+        scale = min(1.0, max(self.scale if scale is None else scale, self.min_height / h))
+        if scale >= 1.0:
+            hands = self.detector.findHands(img, draw=False, flipType=flipType)
+        else:
+            size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            if self.proxy is None or self.proxy.shape[1::-1] != size: self.proxy = np.empty((size[1], size[0], 3), np.uint8)
+            # INTER_AREA is as cheap as INTER_LINEAR only for an exact halving (about 8x slower at 0.75)
+            halved = size[0] * 2 == w and size[1] * 2 == h
+            cv2.resize(img, size, dst=self.proxy, interpolation=cv2.INTER_AREA if halved else cv2.INTER_LINEAR)
+            # cvzone truncates landmark coordinates to whole proxy pixels, so map pixel centres
+            fx, fy = w / size[0], h / size[1]
+            hands = [hand_from_landmarks([[int((p[0] + 0.5) * fx), int((p[1] + 0.5) * fy), int(p[2] * fx)] for p in hand["lmList"]], hand["type"])
+                     for hand in self.detector.findHands(self.proxy, draw=False, flipType=flipType)]
+        return (hands, img) if draw else hands
+
+
+class HandTracker:
+    # Wraps a HandDetector. Full-frame detection runs every `detect_every` frames;
+    # in between the previous landmarks are propagated with pyramidal Lucas-Kanade
+    # optical flow. If too few landmarks track cleanly the detector is re-run on a
+    # padded ROI around the last bbox, and only if that misses on the full frame.
+    def __init__(self, detector, detect_every=5, roi_padding=0.5, min_tracked=0.9, max_fb_error=2.0):
+        self.detector = detector
+        self.detect_every = detect_every
+        self.roi_padding = roi_padding
+        self.min_tracked = min_tracked
+        self.max_fb_error = max_fb_error
+        self.lk_params = dict(winSize=(15, 15), maxLevel=2,
+                              criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+
+        self.prev_gray = None
+        self.prev_hands = []
+        self.frames_since_detect = 0
+        self.gray_buffers = [None, None] # current / previous grey frame, swapped each frame
+
+        # Stats
+        self.full_detections = 0
+        self.roi_detections = 0
+        self.tracked_frames = 0
+
+    def reset(self):
+        self.prev_gray = None
+        self.prev_hands = []
+
+    def findHands(self, img, draw=True, flipType=True):
+        buf = self.gray_buffers[0]
+        if buf is None or buf.shape != img.shape[:2]: buf = None
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=buf)
+        self.gray_buffers = [self.gray_buffers[1], gray]
+        hands = None
+        if self.prev_hands and self.prev_gray is not None and self.frames_since_detect + 1 < self.detect_every:
+            hands = self.track(gray)
+            if hands is None: hands = self.detect_roi(img, flipType)
+        if hands is None:
+            hands = self.detector.findHands(img, draw=False, flipType=flipType)
+            self.full_detections += 1
+            self.frames_since_detect = 0
+        else:
+            self.frames_since_detect += 1
+
+        self.prev_gray = gray
+        self.prev_hands = hands
+        return (hands, img) if draw else hands
+
+    def track(self, gray):
+        hands = []
+        for hand in self.prev_hands:
+            pts = np.array([[p[0], p[1]] for p in hand["lmList"]], np.float32).reshape(-1, 1, 2)
+            nxt, status, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, pts, None, **self.lk_params)
+            back, status_b, _ = cv2.calcOpticalFlowPyrLK(gray, self.prev_gray, nxt, None, **self.lk_params)
+            fb_error = np.linalg.norm((pts - back).reshape(-1, 2), axis=1)
+            ok = (status.reshape(-1) == 1) & (status_b.reshape(-1) == 1) & (fb_error < self.max_fb_error)
+            if ok.mean() < self.min_tracked: return None
+
+            h, w = gray.shape
+            nxt = nxt.reshape(-1, 2)
+            if nxt[:, 0].min() < 0 or nxt[:, 1].min() < 0 or nxt[:, 0].max() >= w or nxt[:, 1].max() >= h: return None
+            lmList = [[int(round(x)), int(round(y)), p[2]] for (x, y), p in zip(nxt, hand["lmList"])]
+            hands.append(hand_from_landmarks(lmList, hand["type"]))
+        self.tracked_frames += 1
+        return hands
+
+    def detect_roi(self, img, flipType=True):
+        h, w, _ = img.shape
+        xs, ys = [], []
+        for hand in self.prev_hands:
+            x, y, bw, bh = hand["bbox"]
+            pad = int(max(bw, bh) * self.roi_padding)
+            xs += [x - pad, x + bw + pad]
+            ys += [y - pad, y + bh + pad]
+        x1, y1 = max(0, min(xs)), max(0, min(ys))
+        x2, y2 = min(w, max(xs)), min(h, max(ys))
+        if x2 - x1 < 2 or y2 - y1 < 2: return None
+
+        found = self.detector.findHands(img[y1:y2, x1:x2], draw=False, flipType=flipType)
+        if len(found) < len(self.prev_hands): return None
+        self.roi_detections += 1
+        return [hand_from_landmarks([[p[0] + x1, p[1] + y1, p[2]] for p in hand["lmList"]], hand["type"]) for hand in found]
+
+    def stats(self):
+        total = self.full_detections + self.tracked_frames + self.roi_detections
+        return {"full": self.full_detections, "roi": self.roi_detections, "tracked": self.tracked_frames,
+                "full_ratio": self.full_detections / total if total else 0.0}
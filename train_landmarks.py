@@ -0,0 +1,41 @@
+import numpy as np
+import argparse
+import os
+import time
+from landmarks import LandmarkClassifier, train_mlp
+
+# Trains the landmark MLP from Data/landmarks/<label>.npy (landmarkcollection.py)
+parser = argparse.ArgumentParser()
+parser.add_argument("--data", default="Data/landmarks")
+parser.add_argument("--out", default=os.path.join("Model", "landmark_model.npz"))
+parser.add_argument("--hidden", type=int, default=64)
+parser.add_argument("--epochs", type=int, default=300)
+parser.add_argument("--val-split", type=float, default=0.2)
+args = parser.parse_args()
+
+labels = sorted(f[:-4] for f in os.listdir(args.data) if f.endswith(".npy"))
+if not labels: raise SystemExit(f"No landmark files in {args.data}")
+X = np.concatenate([np.load(os.path.join(args.data, f"{l}.npy")) for l in labels])
+y = np.concatenate([np.full(len(np.load(os.path.join(args.data, f"{l}.npy"))), i) for i, l in enumerate(labels)])
+
+rng = np.random.default_rng(0)
+order = rng.permutation(len(X))
+n_val = int(len(X) * args.val_split)
+val_idx, train_idx = order[:n_val], order[n_val:]
+
+weights = train_mlp(X[train_idx], y[train_idx], len(labels), hidden=args.hidden, epochs=args.epochs)
+os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+np.savez(args.out, labels=np.array(labels), **weights)
+
+model = LandmarkClassifier(args.out)
+train_acc = np.mean(model.predict(X[train_idx]).argmax(axis=1) == y[train_idx])
+print(f"Train accuracy: {train_acc:.3f} ({len(train_idx)} samples)")
+if n_val:
+    val_acc = np.mean(model.predict(X[val_idx]).argmax(axis=1) == y[val_idx])
+    print(f"Val accuracy:   {val_acc:.3f} ({n_val} samples)")
+
+sample = X[:1]
+start = time.perf_counter()
+for _ in range(1000): model.predict(sample)
+print(f"Latency: {(time.perf_counter() - start):.3f} ms per hand")
+print(f"Saved {args.out} ({len(labels)} classes)")
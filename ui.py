@@ -4,8 +4,10 @@ import tkinter as tk
 from tkinter import messagebox
 import threading
 import json
+import time
 from PIL import Image, ImageTk
-from test import SignLanguageTranslator
+from history_store import HistoryStore
+from virtual_list import VirtualList
 
 # ------------------ THEME CONFIG ------------------ #
 ctk.set_appearance_mode("Dark")
@@ -20,8 +22,11 @@ COLOR_BTN_PRIMARY = "#0EA5E9"
 COLOR_BTN_PRIMARY_HOVER = "#0284C7"
 COLOR_BTN_DANGER = "#EF4444"
 COLOR_CARD_BG = "#1E293B"
+HISTORY_PAGE = 100 # transcripts fetched per "Load more"
+CUSTOM_ROW_HEIGHT = 30
+HISTORY_ROW_HEIGHT = 44
 
-translator = None
+translator = None # created by the background loader (preload_translator)
 translator_thread = None
 
 class SignLanguageApp:
@@ -46,24 +51,65 @@ class SignLanguageApp:
             "camera_access": False,
             "auto_input": True,
             "suggestion_mode": "inbuilt", # "off", "inbuilt", "custom"
-            "stability_time": 1.0 # 1, 2, 3, 4, 5
+            "stability_time": 1.0, # 1, 2, 3, 4, 5
+            "pipelined": False,
+            "classifier": "image", # "image", "landmarks"
+            "backend": "keras", # "keras", "tflite" (Model/model.tflite from convert_tflite.py)
+            "tflite_threads": 2,
+            "tracking": False, # full hand detection only every "detect_every" frames
+            "detect_every": 5,
+            "two_hands": False, # detect both hands, classified in one batch; "hand_policy" picks the signing one
+            "hand_policy": "largest", # "largest", "dominant", "continuity", "confident"
+            "dominant_hand": "Right",
+            "detect_scale": 1.0, # hand detection on a downscaled frame, e.g. 0.5 (see benchmark.py --detect-scales)
+            "prediction_cache": True, # reuse predictions while a pose is held
+            "adaptive_rate": False, # lower frame rate / detection only while no hand is in view
+            "standby_after": 3.0,
+            "idle_after": 15.0,
+            "metrics_file": None, # e.g. "metrics.jsonl" for per-stage timing export
+            "camera_fps": 30,
+            "camera_fourcc": "MJPG", # "" keeps the driver default (often YUYV, slow at 720p)
+            "camera_buffer": 1 # driver queue depth, 1 = always the newest frame
         }
         
         self.custom_words = []
-        self.history = []
+        self.history_store = HistoryStore() # migrates history.txt on first run
+        self.session_id = time.strftime("%Y%m%d-%H%M%S")
+        self.run_started = None
         self.load_data()
         
         self.setup_main_app()
         self.switch_page("dashboard")
 
+        # TensorFlow / MediaPipe / the spell dictionary load in the background while the UI is up
+        self.loader_status = "Loading Models..."
+        self.loader_done = threading.Event()
+        self.launch_queued = False
+        threading.Thread(target=self.preload_translator, daemon=True).start()
+        self.poll_loader()
+
+    def preload_translator(self):
+        global translator
+        try:
+            from test import SignLanguageTranslator
+            t = SignLanguageTranslator(self.settings["backend"], self.settings["tflite_threads"])
+            t.configure(self.settings)
+            self.loader_status = "Warming Up..."
+            t.warm_up()
+            translator = t
+            self.loader_status = "Models Ready"
+        except Exception as e:
+            print(f"Error preloading translator: {e}")
+            self.loader_status = "Model Load Failed"
+        self.loader_done.set()
+
+    def poll_loader(self):
+        # Tk variables are only touched from the main thread
+        if translator is None or not translator.running:
+            self.status_var.set(self.loader_status)
+        if not self.loader_done.is_set(): self.root.after(200, self.poll_loader)
+
     def load_data(self):
-        # Load History
-        if os.path.exists("history.txt"):
-            try:
-                with open("history.txt", "r") as f:
-                    self.history = [line.strip() for line in f.readlines()]
-            except: self.history = []
-        
         # Load Custom Dict
         if os.path.exists("custom_dict.json"):
             try:
@@ -77,20 +123,13 @@ class SignLanguageApp:
                 json.dump(self.custom_words, f, indent=4)
         except: pass
 
-    def rewrite_history_file(self):
-        try:
-            with open("history.txt", "w") as f:
-                for item in self.history:
-                    f.write(item + "\n")
-        except: pass
-
     def save_history(self, text):
         if not text.strip(): return
-        self.history.append(text)
-        try:
-            with open("history.txt", "a") as f:
-                f.write(text + "\n")
-        except: pass
+        meta = {"classifier": self.settings["classifier"], "backend": self.settings["backend"],
+                "suggestion_mode": self.settings["suggestion_mode"],
+                "duration": round(time.time() - self.run_started, 1) if self.run_started else None}
+        try: self.history_store.add(text.strip(), session=self.session_id, meta=meta)
+        except Exception as e: print(f"Error saving history: {e}")
 
     def get_image(self, path, size):
         try:
@@ -238,10 +277,11 @@ class SignLanguageApp:
         self.entry_custom.pack(side="left", fill="x", expand=True, padx=(0, 10))
         ctk.CTkButton(entry_row, text="+", width=35, height=35, fg_color=COLOR_ACCENT, hover_color=COLOR_BTN_PRIMARY, command=self.add_custom_word).pack(side="right")
 
-        # Scroll List
-        self.scroll_custom = ctk.CTkScrollableFrame(r_inner, fg_color="#0F172A", corner_radius=10, height=300)
-        self.scroll_custom.pack(fill="both", expand=True)
-        self.refresh_custom_list()
+        # Scroll List (only the visible rows exist as widgets)
+        self.custom_list = VirtualList(r_inner, self.make_custom_row, self.bind_custom_row, row_height=CUSTOM_ROW_HEIGHT,
+                                       fg_color="#0F172A", corner_radius=10, height=300)
+        self.custom_list.pack(fill="both", expand=True)
+        self.custom_list.set_items(self.custom_words)
 
     def add_custom_word(self):
         word = self.entry_custom.get().strip().upper()
@@ -251,25 +291,32 @@ class SignLanguageApp:
             return
         self.custom_words.append(word)
         self.save_custom_dict()
+        if translator is not None: translator.add_custom_word(word)
         self.entry_custom.delete(0, 'end')
-        self.refresh_custom_list()
+        self.custom_list.append(word)
 
     def remove_custom_word(self, word):
         if word in self.custom_words:
             self.custom_words.remove(word)
             self.save_custom_dict()
-            self.refresh_custom_list()
-
-    def refresh_custom_list(self):
-        for widget in self.scroll_custom.winfo_children():
-            widget.destroy()
-        
-        for word in self.custom_words:
-            item = ctk.CTkFrame(self.scroll_custom, fg_color="transparent")
-            item.pack(fill="x", pady=2)
-            ctk.CTkLabel(item, text=word, font=("Segoe UI", 12), text_color="white").pack(side="left", padx=5)
-            ctk.CTkButton(item, text="x", width=20, height=20, fg_color="transparent", text_color="#EF4444", hover_color="#334155", command=lambda w=word: self.remove_custom_word(w)).pack(side="right")
-            ctk.CTkFrame(self.scroll_custom, height=1, fg_color="#1E293B").pack(fill="x", padx=5)
+            if translator is not None: translator.remove_custom_word(word)
+            self.custom_list.remove(word)
+
+    def make_custom_row(self, parent):
+        # CTk widgets take their height in the constructor only (place() rejects it);
+        # no propagation so the packed children can't change the fixed row height
+        row = ctk.CTkFrame(parent, fg_color="transparent", height=CUSTOM_ROW_HEIGHT)
+        row.pack_propagate(False)
+        ctk.CTkFrame(row, height=1, fg_color="#1E293B").pack(side="bottom", fill="x", padx=5)
+        row.word = ctk.CTkLabel(row, text="", font=("Segoe UI", 12), text_color="white")
+        row.word.pack(side="left", padx=5)
+        row.remove_btn = ctk.CTkButton(row, text="x", width=20, height=20, fg_color="transparent", text_color="#EF4444", hover_color="#334155")
+        row.remove_btn.pack(side="right")
+        return row
+
+    def bind_custom_row(self, row, word):
+        row.word.configure(text=word)
+        row.remove_btn.configure(command=lambda w=word: self.remove_custom_word(w))
 
     def render_settings(self):
         ctk.CTkLabel(self.page_frame, text="System Settings", font=("Segoe UI", 24, "bold"), text_color="white").pack(anchor="w", pady=(0, 25))
@@ -296,10 +343,23 @@ class SignLanguageApp:
         seg_btn.set(seg_p[self.settings["suggestion_mode"]])
         seg_btn.pack(fill="x", pady=(0, 20))
 
+        ctk.CTkFrame(p, height=1, fg_color="#334155").pack(fill="x", pady=15)
+
+        ctk.CTkLabel(p, text="Letter Classifier", font=("Segoe UI", 14, "bold"), text_color="white").pack(anchor="w", pady=(0, 10))
+        seg_clf = ctk.CTkSegmentedButton(p, values=["Image", "Landmarks"], 
+                                         selected_color=COLOR_ACCENT,
+                                         command=self.update_classifier)
+        seg_clf.set("Landmarks" if self.settings["classifier"] == "landmarks" else "Image")
+        seg_clf.pack(fill="x", pady=(0, 20))
+
         ctk.CTkFrame(p, height=1, fg_color="#334155").pack(fill="x", pady=15)
         self.add_switch(p, "Auto-Analyze Signs", "auto_input")
         self.add_switch(p, "Mirror Camera Feed", "mirror")
         self.add_switch(p, "Dark Mode Overlay", "dark_mode")
+        self.add_switch(p, "Pipelined Processing", "pipelined")
+        self.add_switch(p, "Hand Tracking (Low CPU)", "tracking")
+        self.add_switch(p, "Power Saving When Idle", "adaptive_rate")
+        self.add_switch(p, "Two-Hand Detection", "two_hands")
 
     def update_stability(self, value):
         self.settings["stability_time"] = float(value.replace("s", ""))
@@ -308,6 +368,9 @@ class SignLanguageApp:
         mapping = {"Off": "off", "Inbuilt": "inbuilt", "Custom": "custom"}
         self.settings["suggestion_mode"] = mapping[value]
 
+    def update_classifier(self, value):
+        self.settings["classifier"] = value.lower()
+
     def add_switch(self, parent, text, key):
         row = ctk.CTkFrame(parent, fg_color="transparent")
         row.pack(fill="x", pady=5)
@@ -326,6 +389,7 @@ class SignLanguageApp:
         controls = [
             ("Spacebar", "Add current character (Manual)"),
             ("Number [1-3]", "Select Word Suggestion"),
+            ("Key [H]", "Toggle performance HUD"),
             ("Key [Q]", "Exit Translator session"),
             ("Mouse Click", "Interact with on-screen buttons")
         ]
@@ -340,27 +404,67 @@ class SignLanguageApp:
         ctk.CTkLabel(self.page_frame, text="Translation History", font=("Segoe UI", 24, "bold"), text_color="white").pack(anchor="w", pady=(0, 25))
         btn_bar = ctk.CTkFrame(self.page_frame, fg_color="transparent")
         btn_bar.pack(fill="x", pady=(0, 10))
+        self.history_search = ctk.CTkEntry(btn_bar, placeholder_text="Search transcripts...", width=300, height=32)
+        self.history_search.pack(side="left")
+        self.history_search.bind("<Return>", lambda e: self.fill_history())
         ctk.CTkButton(btn_bar, text="🗑 Clear All", fg_color=COLOR_BTN_DANGER, hover_color="#C2410C", width=100, command=self.clear_all_history).pack(side="right")
-        container = ctk.CTkScrollableFrame(self.page_frame, fg_color=COLOR_CARD_BG, corner_radius=15)
-        container.pack(fill="both", expand=True)
-        if not self.history:
-            ctk.CTkLabel(container, text="No recordings yet.", font=("Segoe UI", 13), text_color=COLOR_TEXT_MUTED).pack(pady=40)
-        else:
-            for i, item in enumerate(reversed(self.history)):
-                idx = len(self.history) - 1 - i
-                row = ctk.CTkFrame(container, fg_color="transparent")
-                row.pack(fill="x", padx=10, pady=5)
-                ctk.CTkLabel(row, text=item, font=("Segoe UI", 13), text_color="white", justify="left", anchor="w").pack(side="left", fill="x", expand=True, padx=10)
-                ctk.CTkButton(row, text="Delete", width=60, height=24, fg_color="#450a0a", hover_color="#7f1d1d", command=lambda x=idx: self.delete_history_item(x)).pack(side="right", padx=5)
-                ctk.CTkFrame(container, height=1, fg_color="#334155").pack(fill="x", padx=10)
-
-    def delete_history_item(self, index):
-        if 0 <= index < len(self.history):
-            self.history.pop(index); self.rewrite_history_file(); self.render_history()
+        self.history_list = VirtualList(self.page_frame, self.make_history_row, self.bind_history_row, row_height=HISTORY_ROW_HEIGHT,
+                                        fg_color=COLOR_CARD_BG, corner_radius=15, on_end=self.load_more_history)
+        self.history_list.pack(fill="both", expand=True)
+        self.fill_history()
+
+    def make_history_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent", height=HISTORY_ROW_HEIGHT)
+        row.pack_propagate(False)
+        ctk.CTkFrame(row, height=1, fg_color="#334155").pack(side="bottom", fill="x", padx=10)
+        row.stamp = ctk.CTkLabel(row, text="", font=("Segoe UI", 11), text_color=COLOR_TEXT_MUTED, width=120, anchor="w")
+        row.stamp.pack(side="left", padx=(10, 0))
+        row.delete_btn = ctk.CTkButton(row, text="Delete", width=60, height=24, fg_color="#450a0a", hover_color="#7f1d1d")
+        row.delete_btn.pack(side="right", padx=5)
+        row.text = ctk.CTkLabel(row, text="", font=("Segoe UI", 13), text_color="white", justify="left", anchor="w")
+        row.text.pack(side="left", fill="x", expand=True, padx=10)
+        return row
+
+    def bind_history_row(self, row, item):
+        # Rows have a fixed height, so long transcripts are shortened to one line
+        text = item["text"] if len(item["text"]) <= 80 else item["text"][:77] + "..."
+        row.stamp.configure(text=time.strftime("%d %b %Y %H:%M", time.localtime(item["created"])))
+        row.text.configure(text=text)
+        row.delete_btn.configure(command=lambda i=item: self.delete_history_item(i))
+
+    def fill_history(self):
+        # Newest first, one page at a time from the store; a search shows the best matches
+        query = self.history_search.get().strip()
+        try:
+            items = self.history_store.search(query, HISTORY_PAGE) if query else self.history_store.page(HISTORY_PAGE)
+        except Exception as e:
+            print(f"Error reading history: {e}")
+            items = []
+        self.history_has_more = not query and len(items) == HISTORY_PAGE
+        self.history_list.set_items(items, "No matches." if query else "No recordings yet.")
+
+    def load_more_history(self):
+        # Called by the list when scrolled to the bottom
+        if not self.history_has_more: return
+        self.history_has_more = False
+        try:
+            items = self.history_store.page(HISTORY_PAGE, before_id=self.history_list.items[-1]["id"])
+        except Exception as e:
+            print(f"Error reading history: {e}")
+            return
+        self.history_has_more = len(items) == HISTORY_PAGE
+        self.history_list.extend(items)
+
+    def delete_history_item(self, item):
+        try: self.history_store.delete(item["id"])
+        except Exception as e: print(f"Error deleting history: {e}")
+        self.history_list.remove(item)
 
     def clear_all_history(self):
         if messagebox.askyesno("Confirm", "Delete all translation history?"):
-            self.history = []; self.rewrite_history_file(); self.render_history()
+            try: self.history_store.clear()
+            except Exception as e: print(f"Error clearing history: {e}")
+            self.fill_history()
 
     def render_about(self):
         ctk.CTkLabel(self.page_frame, text="About SignBridge", font=("Segoe UI", 24, "bold"), text_color="white").pack(anchor="w", pady=(0, 25))
@@ -397,21 +501,34 @@ class SignLanguageApp:
         lbl.pack(anchor="w", padx=10)
 
     def toggle_camera_access(self):
+        # Opens the shared camera and leaves it open, so Launch doesn't reopen the device
         try:
-            import cv2
-            cap = cv2.VideoCapture(0)
-            if cap.isOpened():
+            from camera import get_camera
+            camera = get_camera(0, 1280, 720, self.settings["camera_fps"], self.settings["camera_fourcc"], self.settings["camera_buffer"])
+            if camera.open():
                 self.settings["camera_access"] = True
                 self.lbl_status.configure(text="Ready", text_color="#10B981")
-                cap.release()
             else: messagebox.showerror("Error", "Camera not found.")
         except: messagebox.showerror("Error", "Camera verification failed.")
 
-    def run_translator_action(self):
+    def run_translator_action(self, queued=False):
         global translator, translator_thread
-        if translator is None: translator = SignLanguageTranslator()
+        if not self.loader_done.is_set():
+            # Still loading: start as soon as the models are ready, without blocking Tk
+            if queued or not self.launch_queued:
+                self.launch_queued = True
+                self.loader_status = "Starting when models are ready..."
+                self.status_var.set(self.loader_status)
+                self.root.after(100, lambda: self.run_translator_action(queued=True))
+            return
+        if self.launch_queued and not queued: return # the queued launch is about to run
+        self.launch_queued = False
+        if translator is None:
+            from test import SignLanguageTranslator
+            translator = SignLanguageTranslator(self.settings["backend"], self.settings["tflite_threads"])
         translator.configure(self.settings)
         if not translator.running:
+            self.run_started = time.time()
             translator_thread = threading.Thread(target=translator.run, daemon=True)
             translator_thread.start()
             self.root.withdraw()
@@ -0,0 +1,102 @@
+import customtkinter as ctk
+import tkinter as tk
+import sys
+
+
+class VirtualList(ctk.CTkFrame):
+    # Scrollable list that only ever creates enough row widgets to fill its height
+    # (plus `buffer`). Scrolling moves a window over `items` and re-binds the same
+    # rows to the new items, and add/remove just re-bind the visible rows, so cost
+    # doesn't grow with the number of items.
+    #   make_row(parent) -> widget     creates one empty row, row_height tall (CTk widgets
+    #                                  only accept their height in the constructor)
+    #   bind_row(row, item)            shows `item` in a row (called again on scroll)
+    #   on_end()                       optional, called when scrolled to the last row (paging)
+    def __init__(self, master, make_row, bind_row, row_height=36, buffer=2, empty_text="", on_end=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.make_row = make_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.buffer = buffer
+        self.on_end = on_end
+        self.items = []
+        self.rows = []
+        self.top = 0
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 4), pady=6)
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True, padx=6, pady=6)
+        self.empty_label = ctk.CTkLabel(self.body, text=empty_text, font=("Segoe UI", 13), text_color="#94A3B8")
+        self.body.bind("<Configure>", lambda e: self.refresh())
+        self.bind_wheel(self.body)
+
+    def bind_wheel(self, widget):
+        # Bound on every real Tk widget of the list (no bind_all, which other pages share)
+        tk.Misc.bind(widget, "<MouseWheel>", self.on_wheel, "+")
+        tk.Misc.bind(widget, "<Button-4>", self.on_wheel, "+")
+        tk.Misc.bind(widget, "<Button-5>", self.on_wheel, "+")
+        for child in widget.winfo_children(): self.bind_wheel(child)
+
+    def on_wheel(self, event):
+        if event.num == 4: step = -1
+        elif event.num == 5: step = 1
+        elif sys.platform == "darwin": step = -event.delta
+        else: step = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self.scroll_to(self.top + step * 2)
+
+    def visible_count(self):
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self.visible_count() if args[2] == "pages" else 1)
+            self.scroll_to(self.top + step)
+
+    def scroll_to(self, top):
+        top = max(0, min(top, len(self.items) - self.visible_count()))
+        if top != self.top:
+            self.top = top
+            self.refresh()
+        if self.on_end and self.top + self.visible_count() >= len(self.items): self.on_end()
+
+    def refresh(self):
+        # Grow the row pool only if the list got taller, then re-bind the visible window
+        needed = self.visible_count() + self.buffer
+        while len(self.rows) < needed:
+            row = self.make_row(self.body)
+            self.bind_wheel(row)
+            self.rows.append(row)
+        self.top = max(0, min(self.top, len(self.items) - self.visible_count()))
+        for i, row in enumerate(self.rows):
+            idx = self.top + i
+            if i < needed and idx < len(self.items):
+                self.bind_row(row, self.items[idx])
+                row.place(x=0, y=i * self.row_height, relwidth=1)
+            else:
+                row.place_forget()
+        if self.items: self.empty_label.place_forget()
+        else: self.empty_label.place(relx=0.5, y=40, anchor="n")
+        n = len(self.items)
+        self.scrollbar.set(self.top / n if n else 0, min(1, (self.top + self.visible_count()) / n) if n else 1)
+
+    def set_items(self, items, empty_text=None):
+        self.items = list(items)
+        self.top = 0
+        if empty_text is not None: self.empty_label.configure(text=empty_text)
+        self.refresh()
+
+    def extend(self, items):
+        self.items.extend(items)
+        self.refresh()
+
+    def append(self, item):
+        self.items.append(item)
+        self.refresh()
+
+    def remove(self, item):
+        if item in self.items:
+            self.items.remove(item)
+            self.refresh()